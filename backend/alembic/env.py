@@ -23,6 +23,11 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Optional session-level memory for index builds (e.g. "1GB" on a roomy host).
+# Unset keeps the server default: a large value can exhaust a container's memory
+# or small /dev/shm during parallel index builds.
+MAINTENANCE_WORK_MEM = os.getenv("MIGRATION_MAINTENANCE_WORK_MEM")
+
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
@@ -42,6 +47,10 @@ def run_migrations_online() -> None:
         future=True,
     )
     with connectable.connect() as connection:
+        if MAINTENANCE_WORK_MEM:
+            # SET is session-scoped, so it survives the per-migration commits and autocommit blocks
+            connection.exec_driver_sql(f"SET maintenance_work_mem = '{MAINTENANCE_WORK_MEM}'")
+            connection.commit()
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
@@ -6,8 +6,6 @@ Create Date: 2025-12-03 10:20:06.035239
 
 """
 from alembic import op
-import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision = '095316958b8a'
@@ -17,16 +15,23 @@ depends_on = None
 
 
 def upgrade():
-    op.add_column('job_candidates', sa.Column('match_score', sa.Integer(), nullable=True))
-    op.add_column('job_candidates', sa.Column('rag_score', sa.Integer(), nullable=True))
-    op.add_column('job_candidates', sa.Column('llm_score', sa.Integer(), nullable=True))
-    op.add_column('job_candidates', sa.Column('analysis_json', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
-    op.add_column('job_candidates', sa.Column('notes', sa.Text(), nullable=True))
+    # One ALTER TABLE: a single ACCESS EXCLUSIVE lock and catalog update instead of five
+    op.execute(
+        "ALTER TABLE job_candidates "
+        "ADD COLUMN match_score INTEGER, "
+        "ADD COLUMN rag_score INTEGER, "
+        "ADD COLUMN llm_score INTEGER, "
+        "ADD COLUMN analysis_json JSONB, "
+        "ADD COLUMN notes TEXT"
+    )
 
 
 def downgrade():
-    op.drop_column('job_candidates', 'notes')
-    op.drop_column('job_candidates', 'analysis_json')
-    op.drop_column('job_candidates', 'llm_score')
-    op.drop_column('job_candidates', 'rag_score')
-    op.drop_column('job_candidates', 'match_score')
\ No newline at end of file
+    op.execute(
+        "ALTER TABLE job_candidates "
+        "DROP COLUMN notes, "
+        "DROP COLUMN analysis_json, "
+        "DROP COLUMN llm_score, "
+        "DROP COLUMN rag_score, "
+        "DROP COLUMN match_score"
+    )
@@ -4,7 +4,11 @@ Revision ID: 0f6a5c2169b1
 Revises: 9c8d6928f5e2
 Create Date: 2025-11-11 11:00:54.943360
 """
+import math
+import os
+
 from alembic import op
+import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision = "0f6a5c2169b1"
@@ -12,6 +16,53 @@ down_revision = "9c8d6928f5e2"
 branch_labels = None
 depends_on = None
 
+# HNSW is the default ANN method: it needs no training pass, so the index is
+# valid on an empty table and recall does not decay as rows are added later.
+# Set ANN_INDEX_METHOD=ivfflat to fall back on memory-constrained hosts.
+ANN_INDEX_METHOD = os.getenv("ANN_INDEX_METHOD", "hnsw").lower()
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 64
+# Past this many rows the default graph loses recall; build a denser one instead
+HNSW_LARGE_TABLE_ROWS = 100_000
+HNSW_LARGE_M = 24
+HNSW_LARGE_EF_CONSTRUCTION = 100
+
+
+def _estimated_rows(table: str) -> int:
+    rows = op.get_bind().execute(
+        sa.text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": table},
+    ).scalar()
+    return max(int(rows or 0), 0)  # reltuples is -1 for never-analyzed tables
+
+
+def _ivfflat_lists(table: str) -> int:
+    """pgvector's sizing rule: rows/1000 up to 1M rows, sqrt(rows) above (never below 10)."""
+    rows = _estimated_rows(table)
+    if rows > 1_000_000:
+        return max(10, int(math.sqrt(rows)))
+    return max(10, rows // 1000)
+
+
+def _create_ann_index(name: str, table: str) -> None:
+    # Index names keep their historical "_ivf" suffix so later migrations can drop them by name.
+    if ANN_INDEX_METHOD == "ivfflat":
+        using = f"ivfflat (embedding vector_cosine_ops) WITH (lists = {_ivfflat_lists(table)})"
+    else:
+        m, ef_construction = HNSW_M, HNSW_EF_CONSTRUCTION
+        if _estimated_rows(table) > HNSW_LARGE_TABLE_ROWS:
+            m, ef_construction = HNSW_LARGE_M, HNSW_LARGE_EF_CONSTRUCTION
+        using = f"hnsw (embedding vector_cosine_ops) WITH (m = {m}, ef_construction = {ef_construction})"
+    # CONCURRENTLY keeps the table readable/writable during the (long) build;
+    # it cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        # Partial: NULL embeddings (rows not embedded yet) are never search hits, so keep
+        # them out of the index. Queries must filter `embedding IS NOT NULL` to use it.
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} USING {using} "
+            f"WHERE embedding IS NOT NULL;"
+        )
+
 
 def upgrade():
     # Ensure pgvector exists
@@ -29,33 +80,16 @@ def upgrade():
     op.execute("ALTER TABLE jobs              ADD COLUMN embedding vector(1536);")
     op.execute("ALTER TABLE resumes           ADD COLUMN embedding vector(1536);")
 
-    # IVF indexes for chunk-level tables
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_resume_emb_ivf
-        ON resume_embeddings USING ivfflat (embedding vector_cosine_ops)
-        WITH (lists = 200);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_job_emb_ivf
-        ON job_embeddings USING ivfflat (embedding vector_cosine_ops)
-        WITH (lists = 200);
-    """)
-
-    # Document-level IVF indexes (for coarse retrieval)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_jobs_doc_ivf
-        ON jobs USING ivfflat (embedding vector_cosine_ops)
-        WITH (lists = 100);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_resumes_doc_ivf
-        ON resumes USING ivfflat (embedding vector_cosine_ops)
-        WITH (lists = 100);
-    """)
+    # ANN indexes for chunk-level tables, then document-level ones (for coarse retrieval)
+    # Query-time knobs (hnsw.ef_search, ivfflat.probes; ~sqrt(lists) is a good start) keep
+    # pgvector's defaults: they are session settings, not schema, and ALTER DATABASE needs ownership.
+    _create_ann_index("idx_resume_emb_ivf", "resume_embeddings")
+    _create_ann_index("idx_job_emb_ivf", "job_embeddings")
+    _create_ann_index("idx_jobs_doc_ivf", "jobs")
+    _create_ann_index("idx_resumes_doc_ivf", "resumes")
 
     # Helpful btree indexes for filters/joins
-    op.execute("CREATE INDEX IF NOT EXISTS idx_resume_chunks_resume_id ON resume_chunks (resume_id);")
-    op.execute("CREATE INDEX IF NOT EXISTS idx_resume_chunks_section   ON resume_chunks (section);")
+    # (resume_chunks is already covered by the composite indexes from 20251105_01_resumes_rag)
     op.execute("CREATE INDEX IF NOT EXISTS idx_job_chunks_job_id       ON job_chunks (job_id);")
     op.execute("CREATE INDEX IF NOT EXISTS idx_job_chunks_section      ON job_chunks (section);")
 
@@ -66,8 +100,6 @@ def downgrade():
     op.execute("DROP INDEX IF EXISTS idx_jobs_doc_ivf;")
     op.execute("DROP INDEX IF EXISTS idx_job_emb_ivf;")
     op.execute("DROP INDEX IF EXISTS idx_resume_emb_ivf;")
-    op.execute("DROP INDEX IF EXISTS idx_resume_chunks_section;")
-    op.execute("DROP INDEX IF EXISTS idx_resume_chunks_resume_id;")
     op.execute("DROP INDEX IF EXISTS idx_job_chunks_section;")
     op.execute("DROP INDEX IF EXISTS idx_job_chunks_job_id;")
 
@@ -77,8 +109,22 @@ def downgrade():
     op.execute("ALTER TABLE jobs              DROP COLUMN IF EXISTS embedding;")
     op.execute("ALTER TABLE resumes           DROP COLUMN IF EXISTS embedding;")
 
-    # Restore 3072-dim columns
-    op.execute("ALTER TABLE job_embeddings    ADD COLUMN embedding vector(3072);")
-    op.execute("ALTER TABLE resume_embeddings ADD COLUMN embedding vector(3072);")
-    op.execute("ALTER TABLE jobs              ADD COLUMN embedding vector(3072);")
-    op.execute("ALTER TABLE resumes           ADD COLUMN embedding vector(3072);")
+    # Restore the pre-revision columns: 1536 dims since 614053cb01e3 / d3fa49a801ac
+    # (which keeps them ANN-indexable, unlike the original 3072)
+    op.execute("ALTER TABLE job_embeddings    ADD COLUMN embedding vector(1536);")
+    op.execute("ALTER TABLE resume_embeddings ADD COLUMN embedding vector(1536);")
+    op.execute("ALTER TABLE jobs              ADD COLUMN embedding vector(1536);")
+    op.execute("ALTER TABLE resumes           ADD COLUMN embedding vector(1536);")
+
+    # ...and the ANN indexes that existed on them before this revision
+    for name, table in (
+        ("idx_job_emb_ivf", "job_embeddings"),
+        ("ix_resume_embeddings_embedding_cos", "resume_embeddings"),
+        ("ix_resumes_embedding_cos", "resumes"),
+    ):
+        op.execute(f"""
+            CREATE INDEX IF NOT EXISTS {name}
+            ON {table} USING hnsw (embedding vector_cosine_ops)
+            WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})
+            WHERE embedding IS NOT NULL;
+        """)
@@ -14,21 +14,32 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
-def _has_table(bind, name: str) -> bool:
-    insp = sa.inspect(bind)
-    return insp.has_table(name)
+AI_COLUMNS = {
+    "analysis_json": lambda: postgresql.JSONB(astext_type=sa.Text()),
+    "analysis_model": lambda: sa.String(64),
+    "analysis_version": lambda: sa.Integer(),
+    "ai_started_at": lambda: sa.DateTime(timezone=True),
+    "ai_finished_at": lambda: sa.DateTime(timezone=True),
+    "ai_error": lambda: sa.Text(),
+}
 
-def _has_col(bind, table: str, col: str) -> bool:
-    insp = sa.inspect(bind)
-    try:
-        return any(c["name"] == col for c in insp.get_columns(table))
-    except Exception:
-        return False
+def _existing_columns(bind, table: str) -> set[str]:
+    # A single pg_attribute lookup answers both "does the table exist" (empty set
+    # when to_regclass() is NULL) and "which columns does it have".
+    rows = bind.execute(
+        sa.text(
+            "SELECT attname FROM pg_attribute "
+            "WHERE attrelid = to_regclass(:table) AND attnum > 0 AND NOT attisdropped"
+        ),
+        {"table": table},
+    )
+    return {r[0] for r in rows}
 
 def upgrade():
     bind = op.get_bind()
+    existing = _existing_columns(bind, "jobs")
 
-    if not _has_table(bind, "jobs"):
+    if not existing:
         op.create_table(
             "jobs",
             sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
@@ -37,31 +48,17 @@ def upgrade():
             sa.Column("free_text", sa.Text(), nullable=True),
             sa.Column("icon", sa.String(64), nullable=True),
             sa.Column("status", sa.String(32), nullable=False, server_default="draft"),
-            sa.Column("analysis_json", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-            sa.Column("analysis_model", sa.String(64), nullable=True),
-            sa.Column("analysis_version", sa.Integer(), nullable=True),
-            sa.Column("ai_started_at", sa.DateTime(timezone=True), nullable=True),
-            sa.Column("ai_finished_at", sa.DateTime(timezone=True), nullable=True),
-            sa.Column("ai_error", sa.Text(), nullable=True),
+            *(sa.Column(name, type_(), nullable=True) for name, type_ in AI_COLUMNS.items()),
             sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
             sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
         )
         op.create_index("ix_jobs_status", "jobs", ["status"])
         op.create_index("ix_jobs_created_at", "jobs", ["created_at"])
     else:
+        missing = [name for name in AI_COLUMNS if name not in existing]
         with op.batch_alter_table("jobs") as batch:
-            if not _has_col(bind, "jobs", "analysis_json"):
-                batch.add_column(sa.Column("analysis_json", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
-            if not _has_col(bind, "jobs", "analysis_model"):
-                batch.add_column(sa.Column("analysis_model", sa.String(64), nullable=True))
-            if not _has_col(bind, "jobs", "analysis_version"):
-                batch.add_column(sa.Column("analysis_version", sa.Integer(), nullable=True))
-            if not _has_col(bind, "jobs", "ai_started_at"):
-                batch.add_column(sa.Column("ai_started_at", sa.DateTime(timezone=True), nullable=True))
-            if not _has_col(bind, "jobs", "ai_finished_at"):
-                batch.add_column(sa.Column("ai_finished_at", sa.DateTime(timezone=True), nullable=True))
-            if not _has_col(bind, "jobs", "ai_error"):
-                batch.add_column(sa.Column("ai_error", sa.Text(), nullable=True))
+            for name in missing:
+                batch.add_column(sa.Column(name, AI_COLUMNS[name](), nullable=True))
 
 def downgrade():
     # שמירה על בטיחות: רק הסרה של העמודות שהוספנו
@@ -4,6 +4,8 @@ Revision ID: 20251105_01_resumes_rag
 Revises: 202511041200
 Create Date: 2025-11-05 00:00:00.000000
 """
+import os
+
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
@@ -15,6 +17,23 @@ down_revision = "202511041200"
 branch_labels = None
 depends_on = None
 
+# HNSW by default (no training pass, valid on empty tables); ANN_INDEX_METHOD=ivfflat falls back.
+ANN_INDEX_METHOD = os.getenv("ANN_INDEX_METHOD", "hnsw").lower()
+
+
+def _create_ann_index(name: str, table: str, opclass: str, lists: int = 100) -> None:
+    if ANN_INDEX_METHOD == "ivfflat":
+        using = f"ivfflat (embedding {opclass}) WITH (lists = {lists})"
+    else:
+        using = f"hnsw (embedding {opclass}) WITH (m = 16, ef_construction = 64)"
+    # Build without blocking writes; CONCURRENTLY must run outside a transaction.
+    with op.get_context().autocommit_block():
+        # Partial: rows without an embedding yet stay out of the index
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} USING {using} "
+            f"WHERE embedding IS NOT NULL;"
+        )
+
 
 def upgrade():
     op.execute("CREATE EXTENSION IF NOT EXISTS vector;")
@@ -48,9 +67,9 @@ def upgrade():
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
         sa.ForeignKeyConstraint(["resume_id"], ["resumes.id"], ondelete="CASCADE"),
     )
-    op.create_index("ix_resume_chunks_resume_id", "resume_chunks", ["resume_id"])
-    op.create_index("ix_resume_chunks_section", "resume_chunks", ["section"])
-    op.create_index("ix_resume_chunks_ord", "resume_chunks", ["ord"])
+    # Chunks are always read per resume: ordered, or filtered by section
+    op.create_index("ix_resume_chunks_resume_ord", "resume_chunks", ["resume_id", "ord"])
+    op.create_index("ix_resume_chunks_resume_section", "resume_chunks", ["resume_id", "section"])
 
     op.create_table(
         "resume_embeddings",
@@ -63,16 +82,10 @@ def upgrade():
         sa.ForeignKeyConstraint(["chunk_id"], ["resume_chunks.id"], ondelete="CASCADE"),
     )
 
-    op.execute("""
-    CREATE INDEX IF NOT EXISTS ix_resume_embeddings_embedding_l2
-    ON resume_embeddings
-    USING ivfflat (embedding vector_l2_ops) WITH (lists = 100);
-    """)
-    op.execute("""
-    CREATE INDEX IF NOT EXISTS ix_resumes_embedding_l2
-    ON resumes
-    USING ivfflat (embedding vector_l2_ops) WITH (lists = 100);
-    """)
+    # Cosine opclass to match the `<=>` operator used everywhere else (0f6a5c2169b1);
+    # an index only serves ORDER BY on the operator of its own opclass.
+    _create_ann_index("ix_resume_embeddings_embedding_cos", "resume_embeddings", "vector_cosine_ops")
+    _create_ann_index("ix_resumes_embedding_cos", "resumes", "vector_cosine_ops")
 
     op.execute("""
     CREATE OR REPLACE FUNCTION touch_updated_at() RETURNS TRIGGER AS $$
@@ -91,12 +104,11 @@ def upgrade():
 def downgrade():
     op.execute("DROP TRIGGER IF EXISTS trg_resumes_updated_at ON resumes;")
     op.execute("DROP FUNCTION IF EXISTS touch_updated_at;")
-    op.drop_index("ix_resumes_embedding_l2", table_name="resumes")
-    op.drop_index("ix_resume_embeddings_embedding_l2", table_name="resume_embeddings")
+    op.drop_index("ix_resumes_embedding_cos", table_name="resumes")
+    op.drop_index("ix_resume_embeddings_embedding_cos", table_name="resume_embeddings")
     op.drop_table("resume_embeddings")
-    op.drop_index("ix_resume_chunks_ord", table_name="resume_chunks")
-    op.drop_index("ix_resume_chunks_section", table_name="resume_chunks")
-    op.drop_index("ix_resume_chunks_resume_id", table_name="resume_chunks")
+    op.drop_index("ix_resume_chunks_resume_section", table_name="resume_chunks")
+    op.drop_index("ix_resume_chunks_resume_ord", table_name="resume_chunks")
     op.drop_table("resume_chunks")
     op.drop_index("ix_resumes_created_at", table_name="resumes")
     op.drop_index("ix_resumes_status", table_name="resumes")
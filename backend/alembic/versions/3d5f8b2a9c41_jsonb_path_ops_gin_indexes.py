@@ -0,0 +1,44 @@
+"""jsonb: GIN (jsonb_path_ops) indexes for containment lookups
+
+jsonb_path_ops indexes only support the containment operators (@>, @?, @@)
+but are about half the size of the default jsonb_ops and faster for @>.
+Queries must use top-level containment (`col @> '{...}'`, SQLAlchemy
+`.contains({...})`); `->`/`->>` extraction with `=` does not use these indexes.
+
+resumes.extraction_json is covered too: resume_repo.find_duplicate looks up
+emails/phones by containment on every ingested file.
+
+Revision ID: 3d5f8b2a9c41
+Revises: f4b7d0c8e21a
+Create Date: 2026-10-16 10:00:00.000000
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3d5f8b2a9c41"
+down_revision = "f4b7d0c8e21a"
+branch_labels = None
+depends_on = None
+
+# (index name, table, column)
+GIN_INDEXES = (
+    ("idx_jobs_analysis_json_gin", "jobs", "analysis_json"),
+    ("idx_job_candidates_analysis_json_gin", "job_candidates", "analysis_json"),
+    ("idx_resumes_extraction_json_gin", "resumes", "extraction_json"),
+)
+
+
+def upgrade():
+    # CONCURRENTLY keeps the tables writable while the indexes build; it must run outside a transaction.
+    with op.get_context().autocommit_block():
+        for name, table, column in GIN_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({column} jsonb_path_ops);"
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _, _ in GIN_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
@@ -1,3 +1,9 @@
+"""resumes: make embedding nullable
+
+Keep embedding columns nullable: bulk loaders (COPY ... FROM STDIN) can then
+write the row metadata first and backfill vectors later in batches, instead
+of having to compute every embedding before the row can exist.
+"""
 from alembic import op
 from pgvector.sqlalchemy import Vector
 
@@ -8,11 +14,11 @@ branch_labels = None
 depends_on = None
 
 def upgrade():
-    op.execute("ALTER TABLE resumes ALTER COLUMN embedding TYPE vector(3072)")
+    op.execute("ALTER TABLE resumes ALTER COLUMN embedding TYPE vector(1536)")
     op.alter_column(
         "resumes",
         "embedding",
-        existing_type=Vector(3072),
+        existing_type=Vector(1536),
         nullable=True,          # הרפיית NOT NULL
         existing_nullable=False # היה NOT NULL קודם
     )
@@ -21,7 +27,7 @@ def downgrade():
     op.alter_column(
         "resumes",
         "embedding",
-        existing_type=Vector(3072),
+        existing_type=Vector(1536),
         nullable=False,
         existing_nullable=True
     )
@@ -0,0 +1,43 @@
+"""resumes: generated file_name / primary_email / primary_phone columns
+
+Stored generated columns derived from file_path and extraction_json, so read
+paths (the job candidates list) select scalars instead of re-deriving them in
+Python for every row. Postgres keeps them current on every write; ingestion
+needs no changes. Adding a STORED column rewrites the table once.
+
+Revision ID: 5a9e3c7d1f20
+Revises: b4c7e1f9a2d5
+Create Date: 2026-10-16 13:00:00.000000
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5a9e3c7d1f20"
+down_revision = "b4c7e1f9a2d5"
+branch_labels = None
+depends_on = None
+
+# Kept in sync with the Computed() expressions on app.models.resume.Resume
+GENERATED_COLUMNS = (
+    ("file_name", r"regexp_replace(file_path, '^.*[\\/]', '')"),
+    ("primary_email", r"""jsonb_path_query_first(extraction_json, '$.person.emails[*].value ? (@ like_regex "\\S")') #>> '{}'"""),
+    ("primary_phone", r"""jsonb_path_query_first(extraction_json, '$.person.phones[*].value ? (@ like_regex "\\S")') #>> '{}'"""),
+)
+
+
+def upgrade():
+    # One ALTER so the table is rewritten once, not per column
+    op.execute(
+        "ALTER TABLE resumes "
+        + ", ".join(
+            f"ADD COLUMN IF NOT EXISTS {name} text GENERATED ALWAYS AS ({expr}) STORED"
+            for name, expr in GENERATED_COLUMNS
+        )
+    )
+
+
+def downgrade():
+    op.execute(
+        "ALTER TABLE resumes "
+        + ", ".join(f"DROP COLUMN IF EXISTS {name}" for name, _ in GENERATED_COLUMNS)
+    )
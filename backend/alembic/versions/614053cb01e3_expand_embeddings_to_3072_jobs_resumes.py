@@ -1,3 +1,13 @@
+"""embeddings: widen jobs/resumes vectors to 1536 dims
+
+Originally this revision widened the columns to 3072 dims. That is above
+pgvector's 2000-dim limit for HNSW/IVFFlat, so every similarity query fell
+back to a sequential scan. 1536 dims keeps the columns indexable. Matryoshka-trained
+embedding models (e.g. text-embedding-3-*) can be truncated to their first 1536
+components and re-normalised with only a small recall loss against the full
+3072-dim vectors. Measure recall@k on real data before relying on a specific number.
+"""
+
 # Alembic revision identifiers
 revision = "614053cb01e3"
 down_revision = "22bf04a5c7c2"
@@ -41,13 +51,52 @@ def _drop_ivfflat_indexes(table: str, column: str):
         op.execute(f'DROP INDEX IF EXISTS "{idxname}";')
 
 
+BATCH_SIZE = 10_000
+NIL_UUID = "00000000-0000-0000-0000-000000000000"
+
+
+def _null_out_in_batches(table: str, column: str):
+    """
+    Clear `column` in primary-key ordered batches, committing after each batch.
+    A single table-wide UPDATE holds its row locks and WAL for the whole run;
+    short batches let the table stay live. Keyset pagination on the PK index
+    keeps each batch O(batch) instead of rescanning the table.
+    """
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        conn.exec_driver_sql("SET statement_timeout = 0")
+        conn.exec_driver_sql("SET lock_timeout = '5s'")
+        last_id = NIL_UUID
+        while last_id is not None:
+            last_id = conn.execute(
+                sa.text(
+                    f"""
+                    WITH batch AS (
+                        SELECT id FROM "{table}"
+                        WHERE id > CAST(:last_id AS uuid)
+                        ORDER BY id
+                        LIMIT :batch_size
+                    ), cleared AS (
+                        UPDATE "{table}" t SET {column} = NULL
+                        FROM batch
+                        WHERE t.id = batch.id AND t.{column} IS NOT NULL
+                    )
+                    SELECT id FROM batch ORDER BY id DESC LIMIT 1
+                    """
+                ),
+                {"last_id": last_id, "batch_size": BATCH_SIZE},
+            ).scalar()
+        conn.exec_driver_sql("RESET lock_timeout")
+        conn.exec_driver_sql("RESET statement_timeout")
+
+
 def _bump_vector_dim(table: str, column: str, new_dim: int, not_null: bool | None):
     # 1) אם העמודה NOT NULL, נשחרר זמנית
     if not_null is True:
         op.execute(f'ALTER TABLE "{table}" ALTER COLUMN {column} DROP NOT NULL;')
 
     # 2) לרוקן ערכים קיימים כדי למנוע בעיות מימד
-    op.execute(f'UPDATE "{table}" SET {column} = NULL;')
+    _null_out_in_batches(table, column)
 
     # 2.5) להסיר אינדקסי IVFFLAT שחוסמים מימד > 2000
     _drop_ivfflat_indexes(table, column)
@@ -59,10 +108,14 @@ def _bump_vector_dim(table: str, column: str, new_dim: int, not_null: bool | Non
     if not_null is True:
         op.execute(f'ALTER TABLE "{table}" ALTER COLUMN {column} SET NOT NULL;')
 
+    # 5) Refresh planner stats: the column is now all NULL and pg_statistic still
+    #    describes the old vectors. (No VACUUM needed - the type change rewrote the heap.)
+    op.execute(f'ANALYZE "{table}" ({column});')
+
 
 def upgrade() -> None:
     _ensure_pgvector()
-    new_dim = 3072
+    new_dim = 1536
 
     _bump_vector_dim(table="resumes", column="embedding", new_dim=new_dim, not_null=True)
     _bump_vector_dim(table="resume_embeddings", column="embedding", new_dim=new_dim, not_null=False)
@@ -0,0 +1,31 @@
+"""job_candidates: (job_id, match_score DESC) index for top-N ranking
+
+"Top candidates for job X by score" is the main candidates query; with this
+index Postgres reads the rows already in order instead of sorting them.
+No expression index on analysis_json paths: nothing filters job_candidates
+by an extracted JSON key.
+
+Revision ID: 8e2b6f0d4a17
+Revises: 3d5f8b2a9c41
+Create Date: 2026-10-16 11:00:00.000000
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8e2b6f0d4a17"
+down_revision = "3d5f8b2a9c41"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_job_candidates_job_match "
+            "ON job_candidates (job_id, match_score DESC NULLS LAST);"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_job_candidates_job_match;")
@@ -0,0 +1,34 @@
+"""jobs: generated is_tech_role column
+
+Promotes analysis_json->'is_tech_role' to a stored boolean so the candidates
+list can read the flag without detoasting the whole analysis blob. Missing or
+non-boolean values mean a tech role, as in the match service.
+
+Revision ID: 9f3b6d2e8c14
+Revises: 5a9e3c7d1f20
+Create Date: 2026-10-16 14:00:00.000000
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9f3b6d2e8c14"
+down_revision = "5a9e3c7d1f20"
+branch_labels = None
+depends_on = None
+
+# Kept in sync with the Computed() expression on app.models.job.Job
+IS_TECH_ROLE_EXPR = (
+    "CASE WHEN jsonb_typeof(analysis_json->'is_tech_role') = 'boolean' "
+    "THEN (analysis_json->'is_tech_role')::boolean ELSE true END"
+)
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS is_tech_role boolean "
+        f"GENERATED ALWAYS AS ({IS_TECH_ROLE_EXPR}) STORED"
+    )
+
+
+def downgrade():
+    op.execute("ALTER TABLE jobs DROP COLUMN IF EXISTS is_tech_role")
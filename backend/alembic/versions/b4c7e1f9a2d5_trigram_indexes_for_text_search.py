@@ -0,0 +1,43 @@
+"""text search: pg_trgm GIN indexes on resumes.parsed_text and jobs.normalized_text
+
+Backs lexical lookups (ILIKE '%term%', `%`/`%>` similarity operators) over
+the full resume text and the normalized job text, so hybrid keyword + semantic
+retrieval does not have to sequentially scan resumes. Partial on NOT NULL:
+rows that were not parsed/analyzed yet have nothing to match.
+
+Revision ID: b4c7e1f9a2d5
+Revises: 8e2b6f0d4a17
+Create Date: 2026-10-16 12:00:00.000000
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b4c7e1f9a2d5"
+down_revision = "8e2b6f0d4a17"
+branch_labels = None
+depends_on = None
+
+# (index name, table, column)
+TRGM_INDEXES = (
+    ("ix_resumes_parsed_text_trgm", "resumes", "parsed_text"),
+    ("ix_jobs_normalized_text_trgm", "jobs", "normalized_text"),
+)
+
+
+def upgrade():
+    # Created by d3fa49a801ac / docker init already; kept idempotent for databases set up otherwise
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    with op.get_context().autocommit_block():
+        for name, table, column in TRGM_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({column} gin_trgm_ops) "
+                f"WHERE {column} IS NOT NULL;"
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _, _ in TRGM_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
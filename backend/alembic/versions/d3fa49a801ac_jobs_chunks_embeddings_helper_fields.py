@@ -13,7 +13,7 @@ down_revision = "614053cb01e3"
 branch_labels = None
 depends_on = None
 
-EMBED_DIM = 3072
+EMBED_DIM = 1536
 
 
 def upgrade():
@@ -77,14 +77,19 @@ def upgrade():
         ),
     )
 
-    # NOTE: Skipping ANN indexes (IVFFLAT/HNSW) because pgvector limits them to <= 2000 dimensions.
-    # Once you switch to 1536D (or halfvec on newer pgvector), add the indexes with:
-    #   CREATE INDEX ... USING hnsw (embedding vector_cosine_ops) WITH (m=16, ef_construction=64);
+    # ANN index on chunk embeddings (1536 dims is within pgvector's 2000-dim index limit).
+    # Built concurrently, outside the transaction.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_emb_ivf
+            ON job_embeddings USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+            WHERE embedding IS NOT NULL;
+        """)
 
 
 def downgrade():
-    # Drop tables & indexes created above
-    # (no ANN indexes were created)
+    # Drop tables & indexes created above (the ANN index goes with job_embeddings)
     op.drop_table("job_embeddings")
     op.drop_index("ix_job_chunks_job_section_ord", table_name="job_chunks")
     op.drop_index("ix_job_chunks_job_id", table_name="job_chunks")
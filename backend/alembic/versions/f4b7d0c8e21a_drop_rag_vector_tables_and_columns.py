@@ -31,6 +31,8 @@ def upgrade() -> None:
     # --- Drop vector/btree indexes first (names accumulated across past migrations) ---
     op.execute("DROP INDEX IF EXISTS ix_resume_embeddings_embedding_l2;")
     op.execute("DROP INDEX IF EXISTS ix_resumes_embedding_l2;")
+    op.execute("DROP INDEX IF EXISTS ix_resume_embeddings_embedding_cos;")
+    op.execute("DROP INDEX IF EXISTS ix_resumes_embedding_cos;")
     op.execute("DROP INDEX IF EXISTS idx_resume_emb_ivf;")
     op.execute("DROP INDEX IF EXISTS idx_job_emb_ivf;")
     op.execute("DROP INDEX IF EXISTS idx_jobs_doc_ivf;")
@@ -69,9 +71,8 @@ def downgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
         sa.ForeignKeyConstraint(["resume_id"], ["resumes.id"], ondelete="CASCADE"),
     )
-    op.create_index("ix_resume_chunks_resume_id", "resume_chunks", ["resume_id"])
-    op.create_index("ix_resume_chunks_section", "resume_chunks", ["section"])
-    op.create_index("ix_resume_chunks_ord", "resume_chunks", ["ord"])
+    op.create_index("ix_resume_chunks_resume_ord", "resume_chunks", ["resume_id", "ord"])
+    op.create_index("ix_resume_chunks_resume_section", "resume_chunks", ["resume_id", "section"])
 
     op.create_table(
         "resume_embeddings",
@@ -108,23 +109,15 @@ def downgrade() -> None:
     )
 
     # ANN indexes (as created by 0f6a5c2169b1, adjusted to 768 dims)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_resume_emb_ivf
-        ON resume_embeddings USING ivfflat (embedding vector_cosine_ops)
-        WITH (lists = 200);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_job_emb_ivf
-        ON job_embeddings USING ivfflat (embedding vector_cosine_ops)
-        WITH (lists = 200);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_jobs_doc_ivf
-        ON jobs USING ivfflat (embedding vector_cosine_ops)
-        WITH (lists = 100);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_resumes_doc_ivf
-        ON resumes USING ivfflat (embedding vector_cosine_ops)
-        WITH (lists = 100);
-    """)
+    for name, table in (
+        ("idx_resume_emb_ivf", "resume_embeddings"),
+        ("idx_job_emb_ivf", "job_embeddings"),
+        ("idx_jobs_doc_ivf", "jobs"),
+        ("idx_resumes_doc_ivf", "resumes"),
+    ):
+        op.execute(f"""
+            CREATE INDEX IF NOT EXISTS {name}
+            ON {table} USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+            WHERE embedding IS NOT NULL;
+        """)
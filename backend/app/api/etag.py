@@ -0,0 +1,31 @@
+# path: backend/app/api/etag.py
+# Purpose: Weak ETag helpers so read endpoints can answer 304 without building a body.
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Request, Response
+
+
+def weak_etag(*parts: object) -> str:
+    """Build a weak validator from version parts (ids, counts, updated_at values)."""
+    digest = hashlib.blake2b(
+        ":".join("" if p is None else str(p) for p in parts).encode(), digest_size=12
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """True when the client's If-None-Match already holds this ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison: W/ prefixes are ignored on both sides
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
@@ -1,12 +1,21 @@
-# Purpose: Job routes with background AI analysis on create and a manual re-run endpoint.
+# Purpose: Job routes with queued background AI analysis on create and a manual re-run endpoint.
 
-import os
+import logging
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import exists, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db.base import get_db, SessionLocal
+from app.api.etag import is_not_modified, not_modified_response, weak_etag
+from app.core.cache import cache_get, cache_set, get_async_redis
+from app.db.base import get_db
+from app.db.session import AsyncSessionLocal, get_async_session
 from app.schemas.job import JobCreate, JobUpdate, JobOut, JobListOut
 from app.services.jobs import service as job_service
+from app.services.jobs import analysis_queue
 from app.models.job_candidate import JobCandidate
 from app.models.job import Job
 from app.models.resume import Resume
@@ -16,6 +25,11 @@ from pydantic import BaseModel
 from typing import Optional, List
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
+logger = logging.getLogger("api.jobs")
+
+CANDIDATES_CACHE_TTL_SECONDS = 300
+CANDIDATES_STREAM_BATCH = 200  # rows fetched per round-trip from the server-side cursor
+_candidate_row = TypeAdapter(CandidateRow)
 
 
 class CandidateUpdate(BaseModel):
@@ -23,6 +37,43 @@ class CandidateUpdate(BaseModel):
     notes: Optional[str] = None
 
 
+class CandidateBulkUpdateItem(CandidateUpdate):
+    resume_id: UUID
+
+
+def _upsert_candidates(db: Session, job_id: UUID, updates: List[CandidateBulkUpdateItem]):
+    """Upsert candidate status/notes on (job_id, resume_id) without committing.
+
+    ON CONFLICT can only SET one column list per statement, so rows are grouped by
+    which fields they change (at most three statements). Returns the stored rows.
+    """
+    groups: dict[tuple[str, ...], list[dict]] = {}
+    for item in updates:
+        changes = {k: v for k, v in {"status": item.status, "notes": item.notes}.items() if v is not None}
+        groups.setdefault(tuple(sorted(changes)), []).append({
+            "job_id": job_id,
+            "resume_id": item.resume_id,
+            "status": item.status or "new",
+            "notes": item.notes,
+        })
+
+    rows = []
+    for fields, values in groups.items():
+        stmt = pg_insert(JobCandidate).values(values)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_job_candidate_job_resume",
+            set_={**{f: stmt.excluded[f] for f in fields}, "updated_at": func.now()},
+        ).returning(JobCandidate.resume_id, JobCandidate.status, JobCandidate.notes)
+        rows.extend(db.execute(stmt).all())
+    return rows
+
+
+def _ensure_job_exists(db: Session, job_id: UUID) -> None:
+    # Index probe; the job row itself is not loaded
+    if not db.scalar(select(exists().where(Job.id == job_id))):
+        raise HTTPException(status_code=404, detail="Job not found")
+
+
 @router.put("/{job_id}/candidates/{resume_id}", status_code=200)
 def update_candidate(
     job_id: UUID, 
@@ -31,145 +82,255 @@ def update_candidate(
     db: Session = Depends(get_db)
 ):
     """Update the status or notes of a candidate for a specific job."""
-    # Check if job exists
-    job = job_service.get_job(db, job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
+    _ensure_job_exists(db, job_id)
 
-    # Check if candidate record exists
-    candidate = db.query(JobCandidate).filter(
-        JobCandidate.job_id == job_id,
-        JobCandidate.resume_id == resume_id
-    ).first()
-
-    if candidate:
-        if payload.status is not None:
-            candidate.status = payload.status
-        if payload.notes is not None:
-            candidate.notes = payload.notes
-    else:
-        # Create new record if it doesn't exist
-        candidate = JobCandidate(
-            job_id=job_id,
-            resume_id=resume_id,
-            status=payload.status or "new",
-            notes=payload.notes
-        )
-        db.add(candidate)
-    
+    # Single atomic upsert on (job_id, resume_id): no SELECT-then-write race
+    # between concurrent PUTs for the same candidate.
+    [row] = _upsert_candidates(
+        db, job_id, [CandidateBulkUpdateItem(resume_id=resume_id, **payload.model_dump())]
+    )
+    db.commit()
+
+    return {"status": "success", "new_status": row.status, "notes": row.notes}
+
+
+@router.put("/{job_id}/candidates", status_code=200)
+def update_candidates(
+    job_id: UUID,
+    payload: List[CandidateBulkUpdateItem],
+    db: Session = Depends(get_db),
+):
+    """Update status/notes of many candidates of a job in one transaction."""
+    _ensure_job_exists(db, job_id)
+
+    # Last update wins when the same resume is listed twice
+    # (one statement cannot upsert the same row twice).
+    updates = list({item.resume_id: item for item in payload}.values())
+    rows = _upsert_candidates(db, job_id, updates)
     db.commit()
-    db.refresh(candidate)
-    
-    return {"status": "success", "new_status": candidate.status, "notes": candidate.notes}
+
+    return {
+        "status": "success",
+        "updated": [
+            {"resume_id": row.resume_id, "new_status": row.status, "notes": row.notes}
+            for row in rows
+        ],
+    }
 
 
 @router.get("/{job_id}/candidates", response_model=List[CandidateRow])
-def get_job_candidates(job_id: UUID, db: Session = Depends(get_db)):
-    """Get all candidates for a job (persisted results)."""
-    
-    # Fetch the job to check if it is a tech role
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
+async def get_job_candidates(
+    job_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_async_session),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=500),
+):
+    """Get candidates for a job (persisted results), best match first.
+
+    Without `limit` every candidate is returned (the client filters by status locally).
+    Responses are cached in Redis (when configured) under a freshness token, so any
+    change to the job, its candidates or their resumes yields a new key. On a miss the
+    JSON array is streamed row by row from a server-side cursor.
+    """
+    # Cheap freshness token; also tells us whether the job exists
+    token = (await db.execute(
+        select(
+            Job.updated_at,
+            func.count(JobCandidate.id),
+            func.max(JobCandidate.updated_at),
+            func.max(Resume.updated_at),
+        ).outerjoin(
+            JobCandidate, JobCandidate.job_id == Job.id
+        ).outerjoin(
+            Resume, JobCandidate.resume_id == Resume.id
+        ).where(
+            Job.id == job_id
+        ).group_by(Job.id)
+    )).one_or_none()
+    if token is None:
         raise HTTPException(status_code=404, detail="Job not found")
-        
-    is_tech_role = job.analysis_json.get("is_tech_role", True) if job.analysis_json else True
 
-    # Join JobCandidate with Resume to get contact info
-    results = db.query(JobCandidate, Resume).join(
+    job_updated_at, count, cands_updated_at, resumes_updated_at = token
+    cache_key = ":".join([
+        "jobcands", str(job_id), str(count),
+        *(ts.isoformat() if ts else "0" for ts in (job_updated_at, cands_updated_at, resumes_updated_at)),
+        str(offset), str(limit or "all"),
+    ])
+    # The freshness token doubles as the ETag: unchanged list -> 304, no body at all
+    etag = weak_etag(cache_key)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json", headers={"ETag": etag})
+
+    # One round-trip: candidate + resume columns, plus the job's tech-role flag.
+    # Only the columns the rows below consume are selected (no full ORM objects).
+    stmt = select(
+        JobCandidate.resume_id,
+        JobCandidate.status,
+        JobCandidate.notes,
+        JobCandidate.match_score,
+        JobCandidate.rag_score,
+        JobCandidate.llm_score,
+        JobCandidate.analysis_json,
+        Resume.file_name,
+        Resume.primary_email,
+        Resume.primary_phone,
+        Resume.extraction_json,
+        Resume.created_at,
+        Job.is_tech_role,
+    ).join(
         Resume, JobCandidate.resume_id == Resume.id
-    ).filter(
+    ).join(
+        Job, JobCandidate.job_id == Job.id
+    ).where(
         JobCandidate.job_id == job_id
-    ).all()
-    
-    candidates = []
-    
-    def _format_experience(years):
-        if years is None: return "0 yrs"
+    ).order_by(
+        JobCandidate.match_score.desc().nullslast()  # served by ix_job_candidates_job_match
+    ).offset(offset).limit(limit)
+
+    # Run the query and fetch the first batch before committing to a 200, so a failing
+    # query still surfaces as a normal error response instead of a truncated body.
+    session = AsyncSessionLocal()
+    try:
+        result = await session.stream(stmt.execution_options(yield_per=CANDIDATES_STREAM_BATCH))
+        partitions = result.partitions()
+        first = await anext(partitions, [])
+    except Exception:
+        await session.close()
+        raise
+
+    return StreamingResponse(
+        _stream_candidates(session, first, partitions, cache_key),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
+async def _stream_candidates(session: AsyncSession, first, partitions, cache_key: str):
+    """Yield the candidates as a JSON array, one serialized row at a time.
+
+    Takes over the route's own session (closed here) so the cursor outlives the request
+    dependency. The serialized bytes are kept only when a cache is configured, to store them at the end.
+    """
+    parts: list[bytes] | None = [] if get_async_redis() is not None else None
+    separator = b"["
+    try:
+        partition = first
+        while partition:
+            for row in partition:
+                chunk = separator + _candidate_row.dump_json(_build_candidate_row(row))
+                separator = b","
+                if parts is not None:
+                    parts.append(chunk)
+                yield chunk
+            partition = await anext(partitions, [])
+    except Exception:
+        # Headers are already sent; the client only sees a cut-off body, so leave a trace here
+        logger.exception("Candidate stream failed mid-response (%s)", cache_key)
+        raise
+    finally:
+        await session.close()
+    tail = b"]" if separator == b"," else b"[]"
+    yield tail
+    if parts is not None:
+        parts.append(tail)
+        await cache_set(cache_key, b"".join(parts), CANDIDATES_CACHE_TTL_SECONDS)
+
+
+def _format_experience(years):
+    if years is None: return "0 yrs"
+    try:
+        y = float(years)
+        if y < 1 and y > 0: return "<1 yr"
+        if y % 1 == 0: return f"{int(y)} yrs"
+        return f"{y:.1f} yrs"
+    except:
+        return str(years)
+
+
+def _ensure_string(value):
+    if isinstance(value, list):
+        return "\n".join(str(item) for item in value)
+    return str(value) if value else ""
+
+
+def _build_candidate_row(row) -> CandidateRow:
+    # Parse stored analysis + extraction data
+    analysis = row.analysis_json or {}
+    extraction = row.extraction_json or {}
+    person = extraction.get("person") or {}
+
+    # Determine stability score safely
+    stability = analysis.get("stability", {})
+    stability_score = 0
+    if stability and isinstance(stability, dict):
         try:
-            y = float(years)
-            if y < 1 and y > 0: return "<1 yr"
-            if y % 1 == 0: return f"{int(y)} yrs"
-            return f"{y:.1f} yrs"
-        except:
-            return str(years)
-
-    def _ensure_string(value):
-        if isinstance(value, list):
-            return "\n".join(str(item) for item in value)
-        return str(value) if value else ""
-
-    for jc, resume in results:
-        # Parse stored analysis + extraction data
-        analysis = jc.analysis_json or {}
-        extraction = resume.extraction_json or {}
-        person = extraction.get("person") or {}
-
-        # Determine stability score safely
-        stability = analysis.get("stability", {})
-        stability_score = 0
-        if stability and isinstance(stability, dict):
-            try:
-                stability_numeric = stability.get("score", 0) or 0
-                stability_score = int(float(stability_numeric) * 100)
-            except (TypeError, ValueError):
-                stability_score = 0
-
-        # Derive resume metadata & contact details
-        resume_url = f"/resumes/{resume.id}/file" if resume.file_path else None
-        file_name = os.path.basename(resume.file_path) if resume.file_path else None
-
-        contacts = resume_utils._extract_contacts(person)
-        email = next((c["value"] for c in contacts if c.get("type") == "email"), None)
-        phone = next((c["value"] for c in contacts if c.get("type") == "phone"), None)
-
-        candidate_name = resume_utils._clean(person.get("name")) or resume_utils._infer_name_from_path(resume.file_path)
-        title = resume_utils._extract_profession(
-            extraction.get("experience") or [],
-            extraction.get("education"),
-            person
-        )
-        
-        # Get tech-specific experience years (same logic as match service)
-        exp_meta = extraction.get("experience_meta", {})
-        rec_primary = exp_meta.get("recommended_primary_years", {})
-        
-        if is_tech_role:
-            years_of_experience = rec_primary.get("tech")
-        else:
-            years_of_experience = rec_primary.get("other")
-
-        candidates.append(CandidateRow(
-            resume_id=jc.resume_id,
-            match=jc.match_score or 0,
-            candidate=candidate_name or "Unknown",
-            title=title,
-            experience=_format_experience(years_of_experience),
-            email=email,
-            phone=phone,
-            resume_url=resume_url,
-            file_name=file_name,
-            submitted_at=resume.created_at.isoformat() if resume.created_at else None,
-
-            rag_score=jc.rag_score or 0,
-            llm_score=jc.llm_score,
-            llm_verdict=analysis.get("llm_verdict"),
-            llm_strengths=_ensure_string(analysis.get("llm_strengths")),
-            llm_concerns=_ensure_string(analysis.get("llm_concerns")),
-            stability_score=stability_score,
-            stability_verdict=stability.get("verdict") if isinstance(stability, dict) else None,
-            
-            status=jc.status,
-            notes=jc.notes
-        ))
+            stability_numeric = stability.get("score", 0) or 0
+            stability_score = int(float(stability_numeric) * 100)
+        except (TypeError, ValueError):
+            stability_score = 0
+
+    # File name and first email/phone are generated columns on resumes
+    resume_url = f"/resumes/{row.resume_id}/file" if row.file_name else None
+
+    candidate_name = resume_utils._clean(person.get("name")) or resume_utils._infer_name_from_path(row.file_name)
+    title = resume_utils._extract_profession(
+        extraction.get("experience") or [],
+        extraction.get("education"),
+        person
+    )
     
-    # Sort by match score descending
-    candidates.sort(key=lambda x: x.match, reverse=True)
+    # Get tech-specific experience years (same logic as match service)
+    exp_meta = extraction.get("experience_meta", {})
+    rec_primary = exp_meta.get("recommended_primary_years", {})
     
-    return candidates
+    # Generated column; a missing flag already defaults to a tech role (as in the match service)
+    if row.is_tech_role:
+        years_of_experience = rec_primary.get("tech")
+    else:
+        years_of_experience = rec_primary.get("other")
+
+    # Values come from our own DB rows and are already the declared types,
+    # so skip per-field validation (model_construct) for large candidate lists.
+    return CandidateRow.model_construct(
+        resume_id=row.resume_id,
+        match=row.match_score or 0,
+        candidate=candidate_name or "Unknown",
+        title=title,
+        experience=_format_experience(years_of_experience),
+        email=row.primary_email,
+        phone=row.primary_phone,
+        resume_url=resume_url,
+        file_name=row.file_name or None,
+        submitted_at=row.created_at.isoformat() if row.created_at else None,
+
+        rag_score=row.rag_score or 0,
+        llm_score=row.llm_score,
+        llm_verdict=analysis.get("llm_verdict"),
+        llm_strengths=_ensure_string(analysis.get("llm_strengths")),
+        llm_concerns=_ensure_string(analysis.get("llm_concerns")),
+        stability_score=stability_score,
+        stability_verdict=stability.get("verdict") if isinstance(stability, dict) else None,
+        
+        status=row.status,
+        notes=row.notes
+    )
+
+
+def _enqueue_analysis(job_id: UUID) -> None:
+    """Queue AI analysis; the job is already committed, so a queue failure must not fail the write."""
+    try:
+        analysis_queue.enqueue(job_id)
+    except Exception:
+        logger.warning("Could not queue analysis for job %s; use /analyze to retry", job_id, exc_info=True)
 
 
 @router.post("", response_model=JobOut, status_code=201)
-def create_job(payload: JobCreate, background: BackgroundTasks, db: Session = Depends(get_db)):
+def create_job(payload: JobCreate, db: Session = Depends(get_db)):
     job = job_service.create_job(
         db,
         title=payload.title,
@@ -177,36 +338,14 @@ def create_job(payload: JobCreate, background: BackgroundTasks, db: Session = De
         free_text=payload.free_text,
         icon=payload.icon,
         status=payload.status,
+        analysis_json_overrides=(
+            {"additional_skills": payload.additional_skills} if payload.additional_skills else None
+        ),
     )
-    
-    # If additional_skills were provided, store them in analysis_json immediately
-    if payload.additional_skills:
-        # Ensure analysis_json is a dict
-        current_analysis = dict(job.analysis_json) if job.analysis_json and isinstance(job.analysis_json, dict) else {}
-        current_analysis['additional_skills'] = payload.additional_skills
-        
-        job.analysis_json = current_analysis
-        
-        from sqlalchemy.orm.attributes import flag_modified
-        flag_modified(job, "analysis_json")
-        
-        db.add(job)
-        db.commit()
-        db.refresh(job)
-    
-    background.add_task(_analyze_async, job.id)
+    _enqueue_analysis(job.id)
     return job
 
 
-def _analyze_async(job_id: UUID):
-    """Create a short-lived DB session for the background task."""
-    db = SessionLocal()
-    try:
-        job_service.analyze_and_attach_job(db, job_id)
-    finally:
-        db.close()
-
-
 @router.post("/{job_id}/analyze", response_model=JobOut)
 def analyze_job(job_id: UUID, db: Session = Depends(get_db)):
     job = job_service.analyze_and_attach_job(db, job_id)
@@ -216,25 +355,41 @@ def analyze_job(job_id: UUID, db: Session = Depends(get_db)):
 
 
 @router.get("/{job_id}", response_model=JobOut)
-def get_job(job_id: UUID, db: Session = Depends(get_db)):
-    job = job_service.get_job(db, job_id)
+async def get_job(
+    job_id: UUID, request: Request, response: Response, db: AsyncSession = Depends(get_async_session)
+):
+    job = await job_service.get_job_async(db, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
+    etag = weak_etag(job.id, job.updated_at.timestamp())
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
+    return JobOut.from_orm_fast(job)
 
 
 @router.get("", response_model=JobListOut)
-def list_jobs(
-    db: Session = Depends(get_db),
+async def list_jobs(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_session),
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
 ):
-    items, total = job_service.list_jobs(db, offset=offset, limit=limit)
-    return JobListOut(items=items, total=total)
+    count, last_updated = await job_service.list_jobs_version(db)
+    etag = weak_etag(count, last_updated.timestamp() if last_updated else 0, offset, limit)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
+
+    # The version query already did an exact count; reuse it rather than counting again
+    items, total = await job_service.list_jobs(db, offset=offset, limit=limit, total=count)
+    # Rows are trusted DB data: skip per-row validation; FastAPI passes the built model through as-is
+    return JobListOut.model_construct(items=[JobOut.from_orm_fast(job) for job in items], total=total)
 
 
 @router.put("/{job_id}", response_model=JobOut)
-def update_job(job_id: UUID, payload: JobUpdate, background: BackgroundTasks, db: Session = Depends(get_db)):
+def update_job(job_id: UUID, payload: JobUpdate, db: Session = Depends(get_db)):
     job = job_service.get_job(db, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -254,6 +409,12 @@ def update_job(job_id: UUID, payload: JobUpdate, background: BackgroundTasks, db
         if payload.free_text is not None and payload.free_text != job.free_text:
             should_reanalyze = True
 
+    # additional_skills go into analysis_json in the same commit as the other fields
+    # (unless the whole analysis_json was just replaced manually)
+    overrides = None
+    if payload.additional_skills is not None and not manual_analysis_update:
+        overrides = {"additional_skills": payload.additional_skills}
+
     job = job_service.update_job(
         db,
         job,
@@ -262,37 +423,18 @@ def update_job(job_id: UUID, payload: JobUpdate, background: BackgroundTasks, db
         free_text=payload.free_text,
         icon=payload.icon,
         status=payload.status,
+        analysis_json_overrides=overrides,
     )
-    
-    # Update additional_skills in analysis_json if provided
-    # (Only if we didn't just overwrite the whole analysis_json manually)
-    if payload.additional_skills is not None and not manual_analysis_update:
-        # Ensure analysis_json is a dict (it might be None or something else)
-        current_analysis = dict(job.analysis_json) if job.analysis_json and isinstance(job.analysis_json, dict) else {}
-        current_analysis['additional_skills'] = payload.additional_skills
-        
-        # Force update by assigning a new dict (SQLAlchemy JSONB detection)
-        job.analysis_json = current_analysis
-        
-        # Mark the field as modified explicitly if needed, but reassignment usually works
-        from sqlalchemy.orm.attributes import flag_modified
-        flag_modified(job, "analysis_json")
-        
-        db.add(job)
-        db.commit()
-        db.refresh(job)
-    
+
     # Only trigger background AI analysis if content actually changed AND we didn't manually update analysis
     if should_reanalyze and not manual_analysis_update:
-        background.add_task(_analyze_async, job.id)
+        _enqueue_analysis(job.id)
         
     return job
 
 
 @router.delete("/{job_id}", status_code=204)
-def delete_job(job_id: UUID, db: Session = Depends(get_db)):
-    job = job_service.get_job(db, job_id)
-    if not job:
+async def delete_job(job_id: UUID, db: AsyncSession = Depends(get_async_session)):
+    if not await job_service.delete_job(db, job_id):
         raise HTTPException(status_code=404, detail="Job not found")
-    job_service.delete_job(db, job)
     return None
@@ -1,21 +1,43 @@
 # app/api/routes/match.py
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_async_session
-from app.schemas.match import MatchRunRequest, MatchRunResponse, CandidateRow
-from app.services.match.service import MatchService
+from app.schemas.match import MatchRunRequest, MatchRunResponse
+from app.services.common.llm_client import llm_service_errors, llm_unavailable_errors
+from app.services.match.service import JobNotFoundError, MatchService
 
 router = APIRouter(prefix="/match", tags=["match"])
+logger = logging.getLogger("api.match")
 
 @router.post("/run", response_model=MatchRunResponse)
 async def run_match(payload: MatchRunRequest, db: AsyncSession = Depends(get_async_session)):
+    # CancelledError is not an Exception subclass, so a client disconnect still aborts the run
     try:
         res = await MatchService.run(
-            db, 
-            payload.job_id, 
-            payload.top_n, 
+            db,
+            payload.job_id,
+            payload.top_n,
             payload.min_threshold
         )
-        return MatchRunResponse(**res)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    except JobNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except llm_unavailable_errors():
+        logger.warning("Match run for job %s could not reach the LLM service", payload.job_id, exc_info=True)
+        raise HTTPException(status_code=503, detail="LLM service unavailable")
+    except llm_service_errors():
+        logger.exception("Match run for job %s failed in the LLM service", payload.job_id)
+        raise HTTPException(status_code=502, detail="LLM service error")
+    except OperationalError:
+        # Connection/timeout level failure; str() of DB errors renders the whole statement, skip it
+        logger.warning("Match run for job %s hit a database availability error", payload.job_id, exc_info=True)
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    except SQLAlchemyError:
+        logger.exception("Match run for job %s failed", payload.job_id)
+        raise HTTPException(status_code=500, detail="Match failed")
+    # The response model validates and dumps the dict in one pydantic-core pass
+    return res
@@ -5,22 +5,88 @@ for PDF/DOCX/TXT resumes with Hebrew RTL support.
 """
 from __future__ import annotations
 
-import io
+import re
+from email.utils import formatdate
+from functools import lru_cache
+from html import escape
 from pathlib import Path
+from stat import S_ISREG
 from urllib.parse import quote
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse  
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import get_db
-from app.schemas.resume import ResumeDetail, ResumeListOut, ResumeSummary, ResumeSearchAnalysis
+from app.api.etag import is_not_modified, not_modified_response, weak_etag
+from app.db.session import get_async_session
+from app.schemas.resume import ResumeDetail, ResumeListOut, ResumeSearchAnalysis
 from app.services.resumes import ingestion_pipeline as resume_service
 from app.services.resumes import search_service
+from app.services.resumes.parsing_utils import parse_to_text
 
 router = APIRouter(prefix="/resumes", tags=["resumes"])
 
+# Previews are keyed by ETag, so browsers may reuse them but must revalidate after an hour
+PREVIEW_CACHE_CONTROL = "private, max-age=3600, must-revalidate"
+
+# Hebrew block; search() stops at the first hit
+_HEBREW_RE = re.compile(r"[\u0590-\u05FF]")
+
+# TXT preview page; direction is baked in at import time, only {safe_text} is filled per request
+_HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="he" dir="{direction}">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Resume Preview</title>
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, 'Noto Sans Hebrew', sans-serif;
+            line-height: 1.7;
+            padding: 2.5rem;
+            max-width: 850px;
+            margin: 0 auto;
+            background: #ffffff;
+            color: #1e293b;
+            direction: {direction};
+            text-align: {text_align};
+            font-size: 15px;
+        }
+        .content {
+            white-space: pre-wrap;
+            word-wrap: break-word;
+            font-feature-settings: "liga" 1, "calt" 1;
+        }
+        @media print {
+            body {
+                padding: 1.5rem;
+                font-size: 13px;
+            }
+        }
+        @media (max-width: 768px) {
+            body {
+                padding: 1.5rem;
+                font-size: 14px;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="content">{safe_text}</div>
+</body>
+</html>
+    """
+# Kept as UTF-8 bytes so the response body is assembled without a full str.encode() per request
+_HTML_RTL = _HTML_TEMPLATE.replace("{direction}", "rtl").replace("{text_align}", "right").encode()
+_HTML_LTR = _HTML_TEMPLATE.replace("{direction}", "ltr").replace("{text_align}", "left").encode()
+
 
 @router.post("/search/analyze", response_model=ResumeSearchAnalysis)
 def analyze_search(query: str = Query(..., min_length=1)):
@@ -38,166 +104,120 @@ def related_titles(title: str = Query(..., min_length=1)):
 
 
 @router.get("", response_model=ResumeListOut)
-def list_resumes(
-    db: Session = Depends(get_db),
+async def list_resumes(
+    db: AsyncSession = Depends(get_async_session),
     offset: int = Query(0, ge=0),
     limit: int = Query(3000, ge=1, le=10000),
 ):
-    summaries, total = resume_service.list_resume_summaries(db, offset=offset, limit=limit)
-    items = [ResumeSummary(**summary) for summary in summaries]
-    return ResumeListOut(items=items, total=total)
+    summaries, total = await resume_service.list_resume_summaries(db, offset=offset, limit=limit)
+    # Plain dicts: the response model validates and dumps them to JSON in one pydantic-core pass
+    return {"items": summaries, "total": total}
 
 
 @router.get("/{resume_id}", response_model=ResumeDetail)
-def get_resume(resume_id: UUID, db: Session = Depends(get_db)):
-    resume = resume_service.get_resume_detail(db, resume_id)
+async def get_resume(resume_id: UUID, db: AsyncSession = Depends(get_async_session)):
+    resume = await resume_service.get_resume_detail(db, resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
-    return ResumeDetail(**resume)
+    return resume
 
 
 @router.post("/bulk", response_model=list[ResumeDetail])
-def get_bulk_resumes(
+async def get_bulk_resumes(
     resume_ids: list[UUID],
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_session)
 ):
     """
     Fetch detailed data for multiple resumes in a single request.
     """
-    details = resume_service.get_bulk_resume_details(db, resume_ids)
-    return [ResumeDetail(**d) for d in details]
+    return await resume_service.get_bulk_resume_details(db, resume_ids)
 
 
 @router.get("/{resume_id}/file")
-def preview_resume(resume_id: UUID, db: Session = Depends(get_db)):
+async def preview_resume(
+    resume_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_async_session),
+):
     """
     Return resume file for preview:
     - PDF: stream the original file
     - DOCX: convert to HTML with RTL support for Hebrew
     - TXT: return as HTML with proper formatting
     """
-    resume = resume_service.get_resume(db, resume_id)
+    resume = await resume_service.get_resume(db, resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
 
     path = Path(resume.file_path)
-    if not path.exists() or not path.is_file():
+    try:
+        stat = path.stat()
+    except OSError:
+        stat = None
+    if stat is None or not S_ISREG(stat.st_mode):
         raise HTTPException(status_code=404, detail="Resume file missing")
 
+    # Same file bytes + same parsed text -> same preview; a repeat view is a 304 with no body
+    etag = weak_etag(resume.content_hash, stat.st_mtime_ns, resume.updated_at.timestamp())
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    cache_headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Cache-Control": PREVIEW_CACHE_CONTROL,
+    }
+
     mime = (resume.mime_type or "").lower()
     suffix = path.suffix.lower()
     
-    # Encode filename for Content-Disposition header (RFC 5987)
-    # This handles Hebrew and other non-ASCII characters
-    encoded_filename = quote(path.name.encode('utf-8'))
-    
-    # For PDF files, stream the original
+    headers = {**cache_headers, "Content-Disposition": _inline_disposition(path.name)}
+
+    # For PDF files, send the original (FileResponse streams off the event loop / sendfile)
     if suffix == ".pdf" or "pdf" in mime:
-        f = open(path, "rb")
-        headers = {
-            "Content-Disposition": f'inline; filename*=UTF-8\'\'{encoded_filename}',
-        }
-        return StreamingResponse(f, media_type="application/pdf", headers=headers)
+        return FileResponse(path, media_type="application/pdf", headers=headers, stat_result=stat)
     
-    # For DOCX, stream the original so frontend can render it
+    # For DOCX, send the original so frontend can render it
     if suffix == ".docx":
-        f = open(path, "rb")
-        headers = {
-            "Content-Disposition": f'inline; filename*=UTF-8\'\'{encoded_filename}',
-        }
-        return StreamingResponse(f, media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document", headers=headers)
+        return FileResponse(path, media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document", headers=headers, stat_result=stat)
 
     # For TXT, convert to HTML
     if suffix == ".txt":
         html_content = _convert_to_html(path, resume.parsed_text or "")
-        return HTMLResponse(content=html_content)
+        return Response(content=html_content, media_type="text/html; charset=utf-8", headers=cache_headers)
     
-    # Fallback: try to stream as-is
-    f = open(path, "rb")
-    headers = {
-        "Content-Disposition": f'inline; filename*=UTF-8\'\'{encoded_filename}',
-    }
-    return StreamingResponse(f, media_type=mime or "application/octet-stream", headers=headers)
+    # Fallback: send as-is
+    return FileResponse(path, media_type=mime or "application/octet-stream", headers=headers, stat_result=stat)
 
 
 @router.delete("/{resume_id}", status_code=204)
-def delete_resume(resume_id: UUID, db: Session = Depends(get_db)):
-    success = resume_service.delete_resume(db, resume_id)
+async def delete_resume(resume_id: UUID, db: AsyncSession = Depends(get_async_session)):
+    success = await resume_service.delete_resume(db, resume_id)
     if not success:
         raise HTTPException(status_code=404, detail="Resume not found")
     return None
 
 
-def _convert_to_html(file_path: Path, parsed_text: str) -> str:
+@lru_cache(maxsize=4096)
+def _inline_disposition(file_name: str) -> str:
+    """Content-Disposition for inline preview; RFC 5987 encoding keeps Hebrew/non-ASCII names intact."""
+    return f"inline; filename*=UTF-8''{quote(file_name, safe='')}"
+
+
+def _convert_to_html(file_path: Path, parsed_text: str) -> bytes:
     """
     Convert TXT file to HTML for browser display.
     Uses parsed_text (already RTL-fixed) and formats it nicely.
     """
-    from html import escape
-    
     # If we have parsed text, use it (it's already RTL-fixed)
     if parsed_text:
         text = parsed_text
     else:
         # Fallback: read and parse the file
-        from app.services.resumes.parsing_utils import parse_to_text
         text = parse_to_text(file_path)
     
     # Escape HTML and preserve line breaks
     safe_text = escape(text)
     
     # Detect if text contains Hebrew
-    has_hebrew = any('\u0590' <= char <= '\u05FF' for char in text)
-    direction = "rtl" if has_hebrew else "ltr"
-    text_align = "right" if has_hebrew else "left"
-    
-    html = f"""
-<!DOCTYPE html>
-<html lang="he" dir="{direction}">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Resume Preview</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, 'Noto Sans Hebrew', sans-serif;
-            line-height: 1.7;
-            padding: 2.5rem;
-            max-width: 850px;
-            margin: 0 auto;
-            background: #ffffff;
-            color: #1e293b;
-            direction: {direction};
-            text-align: {text_align};
-            font-size: 15px;
-        }}
-        .content {{
-            white-space: pre-wrap;
-            word-wrap: break-word;
-            font-feature-settings: "liga" 1, "calt" 1;
-        }}
-        @media print {{
-            body {{
-                padding: 1.5rem;
-                font-size: 13px;
-            }}
-        }}
-        @media (max-width: 768px) {{
-            body {{
-                padding: 1.5rem;
-                font-size: 14px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="content">{safe_text}</div>
-</body>
-</html>
-    """
-    return html
+    template = _HTML_RTL if _HEBREW_RE.search(text) else _HTML_LTR
+    return template.replace(b"{safe_text}", safe_text.encode())
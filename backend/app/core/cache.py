@@ -0,0 +1,61 @@
+# app/core/cache.py
+# Purpose: Optional Redis connection shared by response caches and the job queue.
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger("core.cache")
+
+_client = None
+_async_client = None
+
+
+def get_redis():
+    """Return the shared Redis client, or None when REDIS_URL is not configured."""
+    global _client
+    if not settings.REDIS_URL:
+        return None
+    if _client is None:
+        # Imported lazily so deployments without Redis don't need the package
+        from redis import Redis
+
+        _client = Redis.from_url(settings.REDIS_URL)
+    return _client
+
+
+def get_async_redis():
+    """Return the shared asyncio Redis client, or None when REDIS_URL is not configured."""
+    global _async_client
+    if not settings.REDIS_URL:
+        return None
+    if _async_client is None:
+        from redis.asyncio import Redis as AsyncRedis
+
+        _async_client = AsyncRedis.from_url(settings.REDIS_URL)
+    return _async_client
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Fetch a cached value; any Redis failure is treated as a miss."""
+    client = get_async_redis()
+    if client is None:
+        return None
+    try:
+        return await client.get(key)
+    except Exception as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return None
+
+
+async def cache_set(key: str, value: bytes, ttl_seconds: int) -> None:
+    """Store a value with a TTL; failures are logged and ignored."""
+    client = get_async_redis()
+    if client is None:
+        return
+    try:
+        await client.setex(key, ttl_seconds, value)
+    except Exception as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
@@ -1,5 +1,6 @@
 # app/core/config.py
 from __future__ import annotations
+from functools import cached_property, lru_cache
 from pathlib import Path
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -16,9 +17,45 @@ class Settings(BaseSettings):
         default=None,
         description="Async PostgreSQL URL (e.g., postgresql+asyncpg://...). Optional; derived if missing.",
     )
+    # Every API, worker and watcher process has its own pools; keep their sum under Postgres max_connections (100)
+    DB_POOL_SIZE: int = Field(default=10, description="Persistent connections kept by the async engine pool")
+    DB_MAX_OVERFLOW: int = Field(default=20, description="Extra async connections allowed above DB_POOL_SIZE under burst")
+    DB_POOL_TIMEOUT: int = Field(default=30, description="Seconds to wait for a free pooled connection before erroring")
+    DB_POOL_RECYCLE: int = Field(default=1800, description="Recycle pooled connections older than this many seconds")
+    DB_POOL_PRE_PING: bool = Field(
+        default=False,
+        description="SELECT 1 before every sync (psycopg) checkout; off by default - pool_recycle + TCP keepalives retire dead connections. The async engine always pre-pings",
+    )
+    DB_SYNC_POOL_SIZE: int = Field(default=5, description="Persistent connections kept by the sync (psycopg) engine pool")
+    DB_SYNC_MAX_OVERFLOW: int = Field(default=10, description="Extra sync connections allowed above DB_SYNC_POOL_SIZE")
+
+    # --- Background queue ---
+    REDIS_URL: str | None = Field(
+        default=None,
+        description="Redis URL for the RQ job-analysis queue (e.g., redis://redis:6379/0). Unset = in-process queue.",
+    )
 
     # --- App info ---
     APP_NAME: str = Field(default="HR-AI Backend")
+    CORS_ORIGINS: list[str] = Field(
+        default=[
+            "http://localhost:3000",
+            "http://127.0.0.1:3000",
+            "http://localhost:5173",
+            "http://127.0.0.1:5173",
+            "http://omniai:3010",
+            "http://omniai-apps:3010",
+        ],
+        description='Allowed browser origins; set as a JSON list in the env, e.g. ["https://hr.example.com"]',
+    )
+    # Deliberately larger than the sync DB pool: most of these threads wait on LLM/HTTP calls,
+    # file parsing and disk I/O. At most DB_SYNC_POOL_SIZE + DB_SYNC_MAX_OVERFLOW of them (15)
+    # hold a sync connection at once; the rest queue for one up to DB_POOL_TIMEOUT, then fail.
+    # Raise the sync pool (within max_connections) rather than this if sync DB routes time out.
+    THREAD_POOL_SIZE: int = Field(
+        default=200,
+        description="Worker threads for sync endpoints/dependencies and run_in_executor(None, ...)",
+    )
 
     # --- AI Models & Services (legacy-friendly fields kept for compatibility) ---
     OLLAMA_BASE_URL: str = Field(default="http://host.docker.internal:11434", description="Base URL of local Ollama server")
@@ -47,7 +84,7 @@ class Settings(BaseSettings):
         env_file = str(ENV_PATH)
         case_sensitive = True
 
-    @property
+    @cached_property
     def database_url_async_effective(self) -> str:
         """
         Prefer DATABASE_URL_ASYNC; if it's missing, derive from DATABASE_URL by swapping
@@ -60,4 +97,11 @@ class Settings(BaseSettings):
         return self.DATABASE_URL
 
 
-settings = Settings()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide Settings instance (env/.env parsed once)."""
+    return Settings()
+
+
+settings = get_settings()
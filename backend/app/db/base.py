@@ -12,7 +12,13 @@ class Base(DeclarativeBase):
 
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,  # proactively validate connections
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_size=settings.DB_SYNC_POOL_SIZE,  # room for background analysis sessions alongside HTTP requests
+    max_overflow=settings.DB_SYNC_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # libpq keepalives surface dead sockets without a per-checkout ping
+    connect_args={"keepalives": 1, "keepalives_idle": 30, "keepalives_interval": 10, "keepalives_count": 3},
 )
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
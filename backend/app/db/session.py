@@ -1,12 +1,28 @@
 # backend/app/db/session.py
 from __future__ import annotations
 from typing import AsyncGenerator
+import orjson
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from app.core.config import settings
 
 ASYNC_URL = settings.database_url_async_effective  # נגזר אוטומטית מ-DATABASE_URL
 
-async_engine = create_async_engine(ASYNC_URL, pool_pre_ping=True)
+async_engine = create_async_engine(
+    ASYNC_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # asyncpg has no libpq keepalives, so ping on checkout to drop connections
+    # left dead by a DB restart/failover instead of failing the first request
+    pool_pre_ping=True,
+    # LIFO reuses the most recently returned connection, so idle extras age out via recycle
+    pool_use_lifo=True,
+    # asyncpg's JSON/JSONB codec hands the raw text to this; orjson parses the
+    # large extraction/analysis blobs much faster than stdlib json.
+    # (Serialization stays on the default: the codec expects str, orjson returns bytes.)
+    json_deserializer=orjson.loads,
+)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
@@ -3,10 +3,16 @@
 This file centralizes server bootstrap concerns (middleware, routers, log levels)
 so background services and domain logic stay isolated in their respective modules.
 """
+import asyncio
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 
 from app.api.routers import health as health_router
 from app.api.routers import jobs as jobs_router
@@ -14,6 +20,9 @@ from app.api.routers import resumes as resumes_router
 from app.api.routers import match as match_router
 from app.api.routers import llm_test as llm_test_router
 from app.core.config import settings
+from app.db.base import engine
+from app.db.session import async_engine
+from app.services.common.llm_client import close_async_http, get_async_http
 
 
 # Configure logging
@@ -38,24 +47,37 @@ logging.getLogger("openai").setLevel(logging.WARNING)
 logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 
-def create_app() -> FastAPI:
-    app = FastAPI(title=settings.APP_NAME, version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Size both thread pools: AnyIO's (sync endpoints/deps) and asyncio's default executor
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREAD_POOL_SIZE
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.THREAD_POOL_SIZE)
+    )
+    # One pooled async HTTP client for LLM calls, shared across requests
+    get_async_http()
+    yield
+    await close_async_http()
+    # Close pooled DB connections cleanly instead of leaving backends to time out
+    await async_engine.dispose()
+    engine.dispose()
+
 
+def create_app(origins: list[str] | None = None) -> FastAPI:
+    app = FastAPI(title=settings.APP_NAME, version="0.1.0", lifespan=lifespan)
+
+    # A frozenset makes the per-request Origin check a hash lookup instead of a list scan
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[
-            "http://localhost:3000",
-            "http://127.0.0.1:3000",
-            "http://localhost:5173",
-            "http://127.0.0.1:5173",
-            "http://omniai:3010",      
-            "http://omniai-apps:3010", 
-        ],
+        allow_origins=frozenset(settings.CORS_ORIGINS if origins is None else origins),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
+    # Compress JSON/HTML bodies; only arguments every Starlette release supports (fastapi is unpinned)
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     app.include_router(health_router.router)
     app.include_router(jobs_router.router)
     app.include_router(resumes_router.router)
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import uuid
-from sqlalchemy import Column, Text, String, Integer, DateTime
+from sqlalchemy import Boolean, Column, Computed, Text, String, Integer, DateTime
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -40,6 +40,12 @@ class Job(Base):
     ai_started_at = Column(DateTime(timezone=True), nullable=True)
     ai_finished_at = Column(DateTime(timezone=True), nullable=True)
     ai_error = Column(Text, nullable=True)
+    # Generated from analysis_json (migration 9f3b6d2e8c14); missing/non-boolean -> tech role
+    is_tech_role = Column(Boolean, Computed(
+        "CASE WHEN jsonb_typeof(analysis_json->'is_tech_role') = 'boolean' "
+        "THEN (analysis_json->'is_tech_role')::boolean ELSE true END",
+        persisted=True,
+    ))
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
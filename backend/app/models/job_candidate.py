@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import uuid
-from sqlalchemy import Column, String, DateTime, ForeignKey, UniqueConstraint, Integer, Text
+from sqlalchemy import Column, String, DateTime, ForeignKey, UniqueConstraint, Index, Integer, Text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -46,4 +46,6 @@ class JobCandidate(Base):
     # Ensure unique pair of job+resume
     __table_args__ = (
         UniqueConstraint('job_id', 'resume_id', name='uq_job_candidate_job_resume'),
+        # Serves "candidates for a job ordered by score" without a sort
+        Index('ix_job_candidates_job_match', job_id, match_score.desc().nullslast()),
     )
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import uuid
-from sqlalchemy import Column, Text, String, Integer, DateTime
+from sqlalchemy import Column, Computed, Text, String, Integer, DateTime
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -25,6 +25,17 @@ class Resume(Base):
     parsed_text = Column(Text, nullable=True)
     extraction_json = Column(JSONB, nullable=True)
 
+    # Generated by Postgres (migration 5a9e3c7d1f20) for cheap reads in list endpoints
+    file_name = Column(Text, Computed(r"regexp_replace(file_path, '^.*[\\/]', '')", persisted=True))
+    primary_email = Column(Text, Computed(
+        r"""jsonb_path_query_first(extraction_json, '$.person.emails[*].value ? (@ like_regex "\\S")') #>> '{}'""",
+        persisted=True,
+    ))
+    primary_phone = Column(Text, Computed(
+        r"""jsonb_path_query_first(extraction_json, '$.person.phones[*].value ? (@ like_regex "\\S")') #>> '{}'""",
+        persisted=True,
+    ))
+
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
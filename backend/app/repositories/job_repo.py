@@ -1,19 +1,24 @@
 # path: backend/app/repositories/job_repo.py
 # Purpose: Data-access only (CRUD) for Job. No business rules here.
+from datetime import datetime
 from typing import Optional, Tuple
 from uuid import UUID
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, delete as sa_delete, literal, select, func, update as sa_update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models.job import Job
+from app.repositories.counts import paginated_total
 
 
-def create(db: Session, *, title: str, job_description: str, free_text: Optional[str], icon: Optional[str], status: str) -> Job:
+def create(db: Session, *, title: str, job_description: str, free_text: Optional[str], icon: Optional[str], status: str, analysis_json: Optional[dict] = None) -> Job:
     job = Job(
         title=title,
         job_description=job_description,
         free_text=free_text,
         icon=icon,
         status=status or "draft",
+        analysis_json=analysis_json,
     )
     db.add(job)
     db.commit()
@@ -25,14 +30,30 @@ def get(db: Session, job_id: UUID) -> Optional[Job]:
     return db.get(Job, job_id)
 
 
-def list_paginated(db: Session, *, offset: int = 0, limit: int = 20) -> Tuple[list[Job], int]:
-    total = db.execute(select(func.count()).select_from(Job)).scalar_one()
-    rows = db.execute(
+async def get_async(db: AsyncSession, job_id: UUID) -> Optional[Job]:
+    return await db.get(Job, job_id)
+
+
+async def list_paginated(
+    db: AsyncSession, *, offset: int = 0, limit: int = 20, total: Optional[int] = None
+) -> Tuple[list[Job], int]:
+    # Callers that already counted the table (e.g. for the ETag) pass it in to skip a second count
+    if total is None:
+        total = await paginated_total(db, Job)
+    rows = (await db.scalars(
         select(Job).order_by(Job.created_at.desc()).offset(offset).limit(limit)
-    ).scalars().all()
+    )).all()
     return rows, total
 
 
+async def list_version(db: AsyncSession) -> Tuple[int, Optional[datetime]]:
+    """(row count, latest updated_at): changes whenever any job is added, edited or removed."""
+    count, last_updated = (
+        await db.execute(select(func.count(), func.max(Job.updated_at)).select_from(Job))
+    ).one()
+    return count, last_updated
+
+
 def update(db: Session, job: Job, **fields) -> Job:
     for k, v in fields.items():
         if v is not None:
@@ -43,6 +64,28 @@ def update(db: Session, job: Job, **fields) -> Job:
     return job
 
 
-def delete(db: Session, job: Job) -> None:
-    db.delete(job)
-    db.commit()
+def merge_analysis_json(db: Session, job: Job, values: dict) -> None:
+    """Merge top-level keys into analysis_json server-side (no commit).
+
+    Postgres applies `analysis_json || :values` in place, so the (possibly large)
+    existing blob is neither loaded nor sent back over the wire.
+    """
+    db.execute(
+        sa_update(Job)
+        .where(Job.id == job.id)
+        .values(
+            analysis_json=func.coalesce(Job.analysis_json, literal({}, JSONB)).op("||")(
+                bindparam("analysis_values", values, type_=JSONB)
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+    # Re-read on next access instead of trusting the stale in-memory copy
+    db.expire(job, ["analysis_json"])
+
+
+async def delete(db: AsyncSession, job_id: UUID) -> bool:
+    # job_candidates rows go with it via ON DELETE CASCADE
+    result = await db.execute(sa_delete(Job).where(Job.id == job_id))
+    await db.commit()
+    return result.rowcount > 0
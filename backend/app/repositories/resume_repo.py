@@ -1,14 +1,16 @@
 from __future__ import annotations
 from typing import Optional, Tuple
 from uuid import UUID
-from sqlalchemy import select, func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
 from app.models.resume import Resume
+from app.repositories.counts import paginated_total
 
 
 def get_by_hash(db: Session, content_hash: str) -> Optional[Resume]:
     stmt = select(Resume).where(Resume.content_hash == content_hash)
-    return db.execute(stmt).scalar_one_or_none()
+    return db.scalar(stmt)
 
 
 def create_resume(db: Session, *, file_path: str, content_hash: str, mime_type: Optional[str], file_size: Optional[int]) -> Resume:
@@ -19,53 +21,61 @@ def create_resume(db: Session, *, file_path: str, content_hash: str, mime_type:
     return r
 
 
-def set_status(db: Session, resume: Resume, *, status: str, error: Optional[str] = None) -> Resume:
-    resume.status = status
-    resume.error = error
+def update_resume(db: Session, resume: Resume, **fields) -> Resume:
+    """Apply several column changes and commit them as one UPDATE in one transaction.
+
+    No refresh: the commit expires the instance, so the next attribute access reloads it
+    anyway - an eager refresh() here would just be an extra full-row SELECT.
+    """
+    for key, value in fields.items():
+        setattr(resume, key, value)
     db.add(resume)
     db.commit()
-    db.refresh(resume)
     return resume
 
 
+def set_status(db: Session, resume: Resume, *, status: str, error: Optional[str] = None) -> Resume:
+    return update_resume(db, resume, status=status, error=error)
+
+
 def attach_parsed_text(db: Session, resume: Resume, *, parsed_text: str) -> Resume:
-    resume.parsed_text = parsed_text
-    db.add(resume)
-    db.commit()
-    db.refresh(resume)
-    return resume
+    return update_resume(db, resume, parsed_text=parsed_text)
 
 
 def attach_extraction(db: Session, resume: Resume, *, extraction_json) -> Resume:
-    resume.extraction_json = extraction_json
-    db.add(resume)
-    db.commit()
-    db.refresh(resume)
-    return resume
+    return update_resume(db, resume, extraction_json=extraction_json)
 
 
-def list_resumes(db: Session, *, offset: int = 0, limit: int = 20) -> Tuple[list[Resume], int]:
+async def list_resumes(db: AsyncSession, *, offset: int = 0, limit: int = 20) -> Tuple[list[Resume], int]:
     # Filter out 'error' status to keep UI clean
     stmt = select(Resume).where(Resume.status != 'error')
     
-    total = db.execute(select(func.count()).select_from(Resume).where(Resume.status != 'error')).scalar_one()
-    rows = db.execute(
-        stmt.order_by(Resume.created_at.desc()).offset(offset).limit(limit)
-    ).scalars().all()
+    total = await paginated_total(db, Resume, Resume.status != 'error')
+    # Summaries only read these columns; skip parsed_text and the rest
+    rows = (await db.scalars(
+        stmt.options(load_only(Resume.id, Resume.file_path, Resume.extraction_json))
+        .order_by(Resume.created_at.desc()).offset(offset).limit(limit)
+    )).all()
     return rows, total
 
 
-def get_resume(db: Session, resume_id: UUID) -> Optional[Resume]:
-    return db.get(Resume, resume_id)
+async def get_resume(db: AsyncSession, resume_id: UUID) -> Optional[Resume]:
+    return await db.get(Resume, resume_id)
 
 
-def delete_resume(db: Session, resume_id: UUID) -> bool:
-    resume = get_resume(db, resume_id)
-    if not resume:
-        return False
-    db.delete(resume)
-    db.commit()
-    return True
+async def get_resumes(db: AsyncSession, resume_ids: list[UUID]) -> list[Resume]:
+    """Fetch several resumes in one query, in the order of `resume_ids` (missing ids skipped)."""
+    if not resume_ids:
+        return []
+    by_id = {r.id: r for r in await db.scalars(select(Resume).where(Resume.id.in_(resume_ids)))}
+    return [by_id[rid] for rid in resume_ids if rid in by_id]
+
+
+async def delete_resume(db: AsyncSession, resume_id: UUID) -> bool:
+    # job_candidates rows go with it via ON DELETE CASCADE
+    result = await db.execute(delete(Resume).where(Resume.id == resume_id))
+    await db.commit()
+    return result.rowcount > 0
 
 
 def find_duplicate(db: Session, email: Optional[str], phone: Optional[str], exclude_id: UUID) -> Optional[Resume]:
@@ -82,7 +92,7 @@ def find_duplicate(db: Session, email: Optional[str], phone: Optional[str], excl
         return None
         
     stmt = select(Resume).where(or_(*conditions)).where(Resume.id != exclude_id).limit(1)
-    return db.execute(stmt).scalar_one_or_none()
+    return db.scalar(stmt)
 
 
 def update_resume_content(db: Session, resume: Resume, *, file_path: str, content_hash: str, parsed_text: str, extraction_json: dict, mime_type: str, file_size: int) -> Resume:
@@ -98,3 +108,36 @@ def update_resume_content(db: Session, resume: Resume, *, file_path: str, conten
     db.refresh(resume)
     return resume
 
+
+
+def mark_error_where_status(db: Session, statuses: list[str], *, error: str, include_null: bool = False) -> list[str]:
+    """Flip every resume in `statuses` to 'error' in one UPDATE; returns the affected file paths."""
+    condition = Resume.status.in_(statuses)
+    if include_null:
+        condition = or_(condition, Resume.status.is_(None))
+    result = db.execute(
+        update(Resume)
+        .where(condition)
+        .values(status="error", error=error)
+        .returning(Resume.file_path)
+        .execution_options(synchronize_session=False)
+    )
+    paths = list(result.scalars())
+    db.commit()
+    return paths
+
+
+def list_files_with_status(db: Session, status: str) -> list[tuple[UUID, str]]:
+    """(id, file_path) pairs only - avoids loading parsed_text/extraction_json blobs."""
+    return [tuple(row) for row in db.execute(select(Resume.id, Resume.file_path).where(Resume.status == status))]
+
+
+def delete_resumes(db: Session, resume_ids: list[UUID]) -> int:
+    if not resume_ids:
+        return 0
+    # job_candidates rows go with them via ON DELETE CASCADE
+    result = db.execute(
+        delete(Resume).where(Resume.id.in_(resume_ids)).execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
@@ -1,7 +1,8 @@
 # Purpose: Pydantic DTOs for Job endpoints including AI analysis fields.
 
+from operator import attrgetter
 from typing import Optional, Any
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, computed_field
 from datetime import datetime
 from uuid import UUID
 
@@ -43,19 +44,29 @@ class JobOut(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    additional_skills: Optional[list[str]] = None
-
-    @model_validator(mode='after')
-    def extract_additional_skills(self):
+    # Derived on serialization rather than by an after-validator, so model_construct paths get it too
+    @computed_field
+    @property
+    def additional_skills(self) -> Optional[list[str]]:
         """Extract additional_skills from analysis_json if available."""
         if self.analysis_json and isinstance(self.analysis_json, dict):
-            self.additional_skills = self.analysis_json.get('additional_skills')
-        return self
+            return self.analysis_json.get('additional_skills')
+        return None
+
+    @classmethod
+    def from_orm_fast(cls, job) -> "JobOut":
+        """Build from a Job row without validation (model_construct); the columns already have the declared types."""
+        return cls.model_construct(**dict(zip(_JOB_OUT_FIELDS, _job_out_values(job))))
 
     class Config:
         from_attributes = True
 
 
+# Read every column JobOut exposes in one C-level call
+_JOB_OUT_FIELDS = tuple(JobOut.model_fields)
+_job_out_values = attrgetter(*_JOB_OUT_FIELDS)
+
+
 class JobListOut(BaseModel):
     items: list[JobOut]
     total: int
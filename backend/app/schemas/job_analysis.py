@@ -1,26 +1,38 @@
 # Purpose: Pydantic schema for validating the Job AI analysis payload.
 
 from typing import List, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Only the analyzer validates against these models, so their core schemas are
+# built on first use instead of when the API process imports this module
+_DEFERRED = ConfigDict(defer_build=True)
 
 
 class SalaryRange(BaseModel):
+    model_config = _DEFERRED
+
     min: Optional[float] = None
     max: Optional[float] = None
     currency: Optional[Literal["ILS", "USD", "EUR"]] = None
 
 
 class LanguageItem(BaseModel):
+    model_config = _DEFERRED
+
     name: str
     level: Optional[Literal["basic", "conversational", "fluent", "native"]] = None
 
 
 class Experience(BaseModel):
+    model_config = _DEFERRED
+
     years_min: Optional[int] = None
     years_max: Optional[int] = None
 
 
 class TechStack(BaseModel):
+    model_config = _DEFERRED
+
     languages: List[str] = Field(default_factory=list)
     frameworks: List[str] = Field(default_factory=list)
     databases: List[str] = Field(default_factory=list)
@@ -28,16 +40,22 @@ class TechStack(BaseModel):
 
 
 class Skills(BaseModel):
+    model_config = _DEFERRED
+
     must_have: List[str] = Field(default_factory=list)
     nice_to_have: List[str] = Field(default_factory=list)
 
 
 class SecurityClearance(BaseModel):
+    model_config = _DEFERRED
+
     mentioned: bool = False
     note: Optional[str] = None
 
 
 class JobAnalysis(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
     version: int = 1
     role_title: Optional[str] = None
     icon: Optional[str] = Field(default=None, description="Single emoji representing the role's domain, shown on the job card")
@@ -58,6 +76,3 @@ class JobAnalysis(BaseModel):
     keywords: List[str] = Field(default_factory=list)
     evidence: List[str] = Field(default_factory=list)
 
-    class Config:
-        extra = "ignore"
-
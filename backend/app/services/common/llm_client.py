@@ -6,17 +6,20 @@ import json
 import logging
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
 
+import httpx
 import requests
 from app.core.config import settings
 
-try:
-    from openai import OpenAI, APIConnectionError, RateLimitError, BadRequestError
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+# The openai SDK takes ~0.4s to import; only pay that when the OpenAI provider is actually used
+OPENAI_AVAILABLE = find_spec("openai") is not None
 
 logger = logging.getLogger("ai.llm")
 
@@ -57,19 +60,74 @@ def _build_openai_client() -> "OpenAI":
     if not OPENAI_AVAILABLE:
         raise RuntimeError("OpenAI library is not installed")
     api_key = _require_api_key()
+    from openai import OpenAI
     return OpenAI(api_key=api_key)
 
 
-# Singleton OpenAI client
-_openai_client: Optional["OpenAI"] = None
+# Singleton OpenAI client (a failed build raises and is not cached, so it is retried next call)
+@lru_cache(maxsize=1)
+def _get_openai_client() -> "OpenAI":
+    client = _build_openai_client()
+    logger.info("OpenAI client initialized")
+    return client
 
 
-def _get_openai_client() -> "OpenAI":
-    global _openai_client
-    if _openai_client is None:
-        _openai_client = _build_openai_client()
-        logger.info("OpenAI client initialized")
-    return _openai_client
+# Singleton AsyncOpenAI client (async code paths)
+@lru_cache(maxsize=1)
+def _get_async_openai_client() -> "AsyncOpenAI":
+    if not OPENAI_AVAILABLE:
+        raise RuntimeError("OpenAI library is not installed")
+    from openai import AsyncOpenAI
+    client = AsyncOpenAI(api_key=_require_api_key())
+    logger.info("AsyncOpenAI client initialized")
+    return client
+
+
+def _openai_api_errors() -> tuple:
+    """OpenAI SDK error types, resolved on demand (only evaluated once an exception is raised)."""
+    if not OPENAI_AVAILABLE:
+        return ()
+    from openai import APIConnectionError, BadRequestError, RateLimitError
+    return (APIConnectionError, RateLimitError, BadRequestError)
+
+
+def llm_unavailable_errors() -> tuple:
+    """Errors meaning the LLM/embedding service could not be reached (connection refused, timeout)."""
+    errors = (httpx.TransportError, requests.ConnectionError, requests.Timeout)
+    if OPENAI_AVAILABLE:
+        from openai import APIConnectionError
+        errors += (APIConnectionError,)
+    return errors
+
+
+def llm_service_errors() -> tuple:
+    """Any failure reported by the LLM/embedding service or its HTTP transport."""
+    errors = (httpx.HTTPError, requests.RequestException)
+    if OPENAI_AVAILABLE:
+        from openai import APIError
+        errors += (APIError,)
+    return errors
+
+
+# Shared async HTTP client for Ollama: keeps connections alive across calls.
+# Opened/closed by the FastAPI lifespan; created lazily elsewhere (workers, scripts).
+ASYNC_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+ASYNC_HTTP_TIMEOUT = httpx.Timeout(180.0)
+_async_http: Optional[httpx.AsyncClient] = None
+
+
+def get_async_http() -> httpx.AsyncClient:
+    global _async_http
+    if _async_http is None or _async_http.is_closed:
+        _async_http = httpx.AsyncClient(limits=ASYNC_HTTP_LIMITS, timeout=ASYNC_HTTP_TIMEOUT)
+    return _async_http
+
+
+async def close_async_http() -> None:
+    global _async_http
+    if _async_http is not None:
+        await _async_http.aclose()
+        _async_http = None
 
 
 def _build_ollama_chat_url() -> str:
@@ -169,24 +227,141 @@ class LLMClient:
         else:
             return self._chat_json_openai(messages, timeout, max_tokens=max_tokens)
 
+    async def chat_text_async(
+        self,
+        messages: List[Dict[str, str]],
+        timeout: int = 60,
+        *,
+        options: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Async variant of chat_text (no worker thread held while waiting)."""
+        if self.provider == "ollama":
+            payload = self._ollama_payload(messages, options)
+            return self._ollama_content(await self._post_ollama_async(payload, timeout))
+        return await self._chat_openai_async(messages, timeout, max_tokens=max_tokens)
+
+    async def chat_json_async(
+        self,
+        messages: List[Dict[str, str]],
+        timeout: int = 90,
+        *,
+        options: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None,
+    ) -> _JSONResponse:
+        """Async variant of chat_json; errors come back as `__llm_error__` like the sync one."""
+        try:
+            if self.provider == "ollama":
+                payload = self._ollama_payload(messages, options, json_format=True)
+                raw = self._ollama_content(await self._post_ollama_async(payload, timeout))
+            else:
+                raw = await self._chat_openai_async(
+                    messages, timeout, max_tokens=max_tokens, response_format={"type": "json_object"}
+                )
+        except Exception as e:
+            logger.exception("Async chat_json error: %s", e)
+            return _JSONResponse(data={"__llm_error__": str(e)})
+        return _JSONResponse(data=self._parse_json_content(raw))
+
+    async def chat_stream_async(
+        self,
+        messages: List[Dict[str, str]],
+        timeout: int = 60,
+        *,
+        options: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None,
+        json_format: bool = False,
+    ) -> AsyncIterator[str]:
+        """Yield content chunks as the model generates them (text, or raw JSON text if json_format)."""
+        if self.provider == "ollama":
+            payload = self._ollama_payload(messages, options, json_format=json_format)
+            payload["stream"] = True
+            async with get_async_http().stream("POST", self.chat_url, json=payload, timeout=timeout) as response:
+                response.raise_for_status()
+                # Ollama streams NDJSON: one {"message": {"content": ...}, "done": bool} per line
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    content = chunk.get("message", {}).get("content", "")
+                    if content:
+                        yield content
+                    if chunk.get("done"):
+                        break
+            return
+
+        kwargs: Dict[str, Any] = {"model": self.model, "messages": messages, "timeout": timeout, "stream": True}
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
+        if json_format:
+            kwargs["response_format"] = {"type": "json_object"}
+        stream = await _get_async_openai_client().chat.completions.create(**kwargs)
+        async for event in stream:
+            if event.choices and event.choices[0].delta.content:
+                yield event.choices[0].delta.content
+
+    async def _post_ollama_async(self, payload: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+        response = await get_async_http().post(self.chat_url, json=payload, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    async def _chat_openai_async(
+        self,
+        messages: List[Dict[str, str]],
+        timeout: int,
+        *,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, str]] = None,
+    ) -> str:
+        kwargs: Dict[str, Any] = {"model": self.model, "messages": messages, "timeout": timeout}
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
+        if response_format is not None:
+            kwargs["response_format"] = response_format
+        resp = await _get_async_openai_client().chat.completions.create(**kwargs)
+        return (resp.choices[0].message.content or "").strip()
+
+    # ===== Shared helpers (sync + async paths) =====
+    def _ollama_payload(
+        self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]], *, json_format: bool = False
+    ) -> Dict[str, Any]:
+        merged_options = self.default_options.copy()
+        if options:
+            merged_options.update(options)
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "stream": False,
+            "think": not OLLAMA_DISABLE_THINKING,
+            "options": merged_options,
+            "keep_alive": "30m",
+        }
+        if json_format:
+            payload["format"] = "json"
+        return payload
+
+    @staticmethod
+    def _ollama_content(body: Dict[str, Any]) -> str:
+        return body.get("message", {}).get("content", "").strip()
+
+    def _parse_json_content(self, raw: str) -> Dict[str, Any]:
+        try:
+            data = self._coerce_json(raw) if raw else {}
+        except json.JSONDecodeError as je:
+            preview = (raw or "")[:1200]
+            logger.error("JSON decode failed; returning error payload")
+            data = {"__llm_error__": f"json_decode_error: {je}", "__raw__": raw, "__raw_preview__": preview}
+        logger.debug("🤖 chat_json parsed keys: %s", list(data.keys()))
+        return data
+
     # ===== Ollama Implementation =====
     def _chat_text_ollama(self, messages: List[Dict[str, str]], timeout: int, *, options: Optional[Dict[str, Any]] = None) -> str:
         try:
-            merged_options = self.default_options.copy()
-            if options:
-                merged_options.update(options)
-            payload = {
-                "model": self.model,
-                "messages": messages,
-                "stream": False,
-                "think": not OLLAMA_DISABLE_THINKING,
-                "options": merged_options,
-                "keep_alive": "30m",
-            }
+            payload = self._ollama_payload(messages, options)
             response = requests.post(self.chat_url, json=payload, timeout=timeout)
             response.raise_for_status()
 
-            content = response.json().get("message", {}).get("content", "").strip()
+            content = self._ollama_content(response.json())
             logger.debug("🤖 Ollama chat_text received %d chars", len(content))
             return content
         except requests.RequestException as e:
@@ -198,31 +373,10 @@ class LLMClient:
 
     def _chat_json_ollama(self, messages: List[Dict[str, str]], timeout: int, *, options: Optional[Dict[str, Any]] = None) -> _JSONResponse:
         try:
-            merged_options = self.default_options.copy()
-            if options:
-                merged_options.update(options)
-            payload = {
-                "model": self.model,
-                "messages": messages,
-                "format": "json",
-                "stream": False,
-                "think": not OLLAMA_DISABLE_THINKING,
-                "options": merged_options,
-                "keep_alive": "30m",
-            }
+            payload = self._ollama_payload(messages, options, json_format=True)
             response = requests.post(self.chat_url, json=payload, timeout=timeout)
             response.raise_for_status()
-            
-            raw = response.json().get("message", {}).get("content", "").strip()
-            try:
-                data = self._coerce_json(raw) if raw else {}
-            except json.JSONDecodeError as je:
-                preview = (raw or "")[:1200]
-                logger.error("JSON decode failed; returning error payload")
-                data = {"__llm_error__": f"json_decode_error: {je}", "__raw__": raw, "__raw_preview__": preview}
-            
-            logger.debug("🤖 Ollama chat_json parsed keys: %s", list(data.keys()))
-            return _JSONResponse(data=data)
+            return _JSONResponse(data=self._parse_json_content(self._ollama_content(response.json())))
         except requests.RequestException as e:
             logger.exception("Ollama chat_json error: %s", e)
             return _JSONResponse(data={"__llm_error__": str(e)})
@@ -245,7 +399,7 @@ class LLMClient:
             content = (resp.choices[0].message.content or "").strip()
             logger.debug("OpenAI chat_text received %d chars", len(content))
             return content
-        except (APIConnectionError, RateLimitError, BadRequestError) as e:
+        except _openai_api_errors() as e:
             logger.exception("OpenAI API error in chat_text: %s", e)
             raise
         except Exception as e:
@@ -265,15 +419,8 @@ class LLMClient:
                 kwargs["max_tokens"] = max_tokens
             resp = client.chat.completions.create(**kwargs)
             raw = (resp.choices[0].message.content or "").strip()
-            try:
-                data = self._coerce_json(raw) if raw else {}
-            except json.JSONDecodeError as je:
-                preview = (raw or "")[:1200]
-                logger.error("JSON decode failed; returning error payload")
-                data = {"__llm_error__": f"json_decode_error: {je}", "__raw__": raw, "__raw_preview__": preview}
-            logger.debug("OpenAI chat_json parsed keys: %s", list(data.keys()))
-            return _JSONResponse(data=data)
-        except (APIConnectionError, RateLimitError, BadRequestError) as e:
+            return _JSONResponse(data=self._parse_json_content(raw))
+        except _openai_api_errors() as e:
             logger.exception("OpenAI API error in chat_json: %s", e)
             return _JSONResponse(data={"__llm_error__": str(e)})
         except Exception as e:
@@ -1,5 +1,5 @@
-"""Thin OpenAI helper module: simple chat completions, JSON parsing wrapper,
-and single-text embedding generation used by legacy or lightweight flows."""
+"""Thin OpenAI helper module: simple chat completions and a JSON parsing wrapper
+used by legacy or lightweight flows."""
 from __future__ import annotations
 import json
 from openai import OpenAI
@@ -38,14 +38,3 @@ def run_json_completion(prompt: str, model: str | None = None) -> dict:
     except json.JSONDecodeError:
         return {"error": "Invalid JSON returned", "raw": text}
 
-
-def get_openai_embedding(text: str, model: str | None = None) -> list[float]:
-    """
-    Generate embeddings using OpenAI's embedding models.
-    """
-    model_name = model or settings.OPENAI_EMBEDDING_MODEL
-    response = client.embeddings.create(
-        model=model_name,
-        input=text,
-    )
-    return response.data[0].embedding
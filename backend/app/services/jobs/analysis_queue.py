@@ -0,0 +1,128 @@
+"""Queue for background job analysis.
+
+When REDIS_URL is configured, job ids are pushed to the RQ "jobs" queue and
+analyzed by a separate `rq worker jobs` process (see app.services.jobs.tasks).
+Without Redis, an in-process dispatcher thread hands them to a small thread pool,
+so up to ANALYSIS_CONCURRENCY LLM analyses run at once. Each job is loaded on
+its own DB session right before its analysis starts, never from a stale copy.
+
+Either way a job is queued at most once until its analysis starts: further
+enqueues while it is pending are dropped (Redis `SET NX` key, or an in-process
+set). The pending mark is cleared when the worker starts, so an edit made
+during a running analysis queues a fresh run."""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID
+
+from app.core.cache import get_redis
+from app.db.base import SessionLocal
+from app.services.jobs import service as job_service
+
+logger = logging.getLogger("jobs.queue")
+
+ANALYSIS_CONCURRENCY = 4  # LLM-bound; more mostly queues up at the model server
+
+RQ_QUEUE_NAME = "jobs"
+RQ_JOB_TIMEOUT = 600  # seconds; LLM analysis of a long description can be slow
+RQ_MAX_QUEUE_WAIT_SECONDS = 3600  # a job still queued after this is discarded by RQ
+# Must outlive the job's time in the queue, or a backed-up queue stops deduping;
+# the worker clears the mark when it starts, the expiry only covers a worker dying first
+PENDING_TTL_SECONDS = RQ_MAX_QUEUE_WAIT_SECONDS + RQ_JOB_TIMEOUT
+
+_queue: "queue.Queue[UUID]" = queue.Queue()
+_worker: threading.Thread | None = None
+_worker_lock = threading.Lock()
+_pending: set[UUID] = set()
+_pending_lock = threading.Lock()
+_rq_queue = None
+
+
+def enqueue(job_id: UUID) -> None:
+    """Schedule AI analysis for a job. Safe to call from any thread."""
+    rq_queue = _get_rq_queue()
+    if rq_queue is not None:
+        if not rq_queue.connection.set(_pending_key(job_id), "1", nx=True, ex=PENDING_TTL_SECONDS):
+            logger.info("Analysis for job %s already pending; skipping enqueue", job_id)
+            return
+        try:
+            rq_queue.enqueue(
+                "app.services.jobs.tasks.analyze_and_attach_job",
+                str(job_id),
+                job_timeout=RQ_JOB_TIMEOUT,
+                ttl=RQ_MAX_QUEUE_WAIT_SECONDS,
+            )
+        except Exception:
+            # Nothing was queued: release the mark so the next edit can retry instead of
+            # being dropped as "already pending" until the key expires
+            rq_queue.connection.delete(_pending_key(job_id))
+            raise
+        return
+    with _pending_lock:
+        if job_id in _pending:
+            return
+        _pending.add(job_id)
+    _ensure_worker()
+    _queue.put(job_id)
+
+
+def mark_started(job_id: UUID) -> None:
+    """Clear the pending mark so later edits can queue another analysis."""
+    redis = get_redis()
+    if redis is not None:
+        redis.delete(_pending_key(job_id))
+    with _pending_lock:
+        _pending.discard(job_id)
+
+
+def _pending_key(job_id: UUID) -> str:
+    return f"job:analyze:pending:{job_id}"
+
+
+def _get_rq_queue():
+    global _rq_queue
+    if _rq_queue is None:
+        connection = get_redis()
+        if connection is None:
+            return None
+        # Imported lazily so deployments without Redis don't need rq installed
+        from rq import Queue
+
+        _rq_queue = Queue(RQ_QUEUE_NAME, connection=connection)
+    return _rq_queue
+
+
+def _ensure_worker() -> None:
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run, name="job-analysis-worker", daemon=True)
+            _worker.start()
+
+
+def _run() -> None:
+    pool = ThreadPoolExecutor(max_workers=ANALYSIS_CONCURRENCY, thread_name_prefix="job-analysis")
+    # Only take a job off the queue once a worker is free, so it stays pending (deduped) until then
+    slots = threading.BoundedSemaphore(ANALYSIS_CONCURRENCY)
+    while True:
+        job_id = _queue.get()
+        slots.acquire()
+        pool.submit(_analyze, job_id, slots)
+
+
+def _analyze(job_id: UUID, slots: threading.BoundedSemaphore) -> None:
+    try:
+        mark_started(job_id)
+        db = SessionLocal()
+        try:
+            if job_service.analyze_and_attach_job(db, job_id) is None:
+                logger.warning("Job %s not found; skipping analysis", job_id)
+        finally:
+            db.close()
+    except Exception:
+        logger.exception("Analysis failed for job %s", job_id)
+    finally:
+        slots.release()
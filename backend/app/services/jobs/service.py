@@ -7,6 +7,7 @@ from uuid import UUID
 from datetime import datetime, timezone
 import logging
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.job import Job
@@ -35,6 +36,7 @@ def create_job(
     free_text: Optional[str],
     icon: Optional[str],
     status: Optional[str],
+    analysis_json_overrides: Optional[dict] = None,
 ) -> Job:
     status_final = status or "draft"
     return job_repo.create(
@@ -44,13 +46,22 @@ def create_job(
         free_text=(free_text.strip() if free_text else None),
         icon=(icon.strip() if icon else None),
         status=status_final,
+        analysis_json=dict(analysis_json_overrides) if analysis_json_overrides else None,
     )
 
 def get_job(db: Session, job_id: UUID) -> Optional[Job]:
     return job_repo.get(db, job_id)
 
-def list_jobs(db: Session, *, offset: int = 0, limit: int = 20) -> Tuple[list[Job], int]:
-    return job_repo.list_paginated(db, offset=offset, limit=limit)
+async def get_job_async(db: AsyncSession, job_id: UUID) -> Optional[Job]:
+    return await job_repo.get_async(db, job_id)
+
+async def list_jobs(
+    db: AsyncSession, *, offset: int = 0, limit: int = 20, total: Optional[int] = None
+) -> Tuple[list[Job], int]:
+    return await job_repo.list_paginated(db, offset=offset, limit=limit, total=total)
+
+async def list_jobs_version(db: AsyncSession) -> Tuple[int, Optional[datetime]]:
+    return await job_repo.list_version(db)
 
 def update_job(
     db: Session,
@@ -61,7 +72,11 @@ def update_job(
     free_text: Optional[str],
     icon: Optional[str],
     status: Optional[str],
+    analysis_json_overrides: Optional[dict] = None,
 ) -> Job:
+    if analysis_json_overrides:
+        # Merged by Postgres; committed together with the fields below
+        job_repo.merge_analysis_json(db, job, analysis_json_overrides)
     fields = dict(
         title=title.strip() if title else None,
         job_description=job_description.strip() if job_description else None,
@@ -71,8 +86,8 @@ def update_job(
     )
     return job_repo.update(db, job, **fields)
 
-def delete_job(db: Session, job: Job) -> None:
-    job_repo.delete(db, job)
+async def delete_job(db: AsyncSession, job_id: UUID) -> bool:
+    return await job_repo.delete(db, job_id)
 
 def analyze_and_attach_job(db: Session, job_id: UUID) -> Optional[Job]:
     job = job_repo.get(db, job_id)
@@ -84,20 +99,31 @@ def analyze_and_attach_job(db: Session, job_id: UUID) -> Optional[Job]:
     db.add(job)
     db.commit()
 
+    _enrich_job(db, job)
+
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+def _enrich_job(db: Session, job: Job) -> None:
+    """Run AI analysis for a job and set the derived fields in place (no commit)."""
     try:
         logger.info("Analyze job '%s' [%s]", job.title, job.id)
 
-        # Preserve existing additional_skills before AI analysis
-        existing_additional_skills = None
-        if job.analysis_json and isinstance(job.analysis_json, dict):
-            existing_additional_skills = job.analysis_json.get('additional_skills')
-
         analysis_json, model_name, version = analyze_job_text(
             title=job.title,
             description=job.job_description,
             free_text=job.free_text,
         )
-        
+
+        # Preserve additional_skills, re-read after the (slow) LLM call so a skills
+        # edit committed while the analysis was running is not overwritten
+        db.refresh(job, ["analysis_json"])
+        existing_additional_skills = None
+        if job.analysis_json and isinstance(job.analysis_json, dict):
+            existing_additional_skills = job.analysis_json.get('additional_skills')
+
         # Restore additional_skills after AI analysis
         if existing_additional_skills is not None:
             analysis_json['additional_skills'] = existing_additional_skills
@@ -125,8 +151,3 @@ def analyze_and_attach_job(db: Session, job_id: UUID) -> Optional[Job]:
         job.ai_finished_at = datetime.now(timezone.utc)
         job.ai_error = str(exc)
         logger.exception("Failed to enrich job '%s': %s", job.title, exc)
-
-    db.add(job)
-    db.commit()
-    db.refresh(job)
-    return job
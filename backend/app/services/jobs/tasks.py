@@ -0,0 +1,26 @@
+"""Job analysis tasks executed by the RQ worker (`rq worker jobs`).
+
+Each task runs in the worker process and opens its own DB session; nothing is
+shared with the API request that enqueued it."""
+from __future__ import annotations
+
+import logging
+from uuid import UUID
+
+from app.db.base import SessionLocal
+from app.services.jobs import analysis_queue
+from app.services.jobs import service as job_service
+
+logger = logging.getLogger("jobs.tasks")
+
+
+def analyze_and_attach_job(job_id: str) -> None:
+    """Run AI analysis for one job and persist the result."""
+    analysis_queue.mark_started(UUID(job_id))
+    db = SessionLocal()
+    try:
+        job = job_service.analyze_and_attach_job(db, UUID(job_id))
+        if job is None:
+            logger.warning("Job %s not found; skipping analysis", job_id)
+    finally:
+        db.close()
@@ -6,7 +6,6 @@ from typing import List, Dict, Any
 from uuid import UUID
 import json
 import asyncio
-from functools import partial
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -376,7 +375,7 @@ class LLMJudge:
                 # Prepare messages
                 messages = [
                     {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": "Here is the data for the job and candidates to evaluate. Please output the JSON evaluation list as requested:\n\n" + json.dumps(user_prompt, ensure_ascii=False, indent=2)}
+                    {"role": "user", "content": "Here is the data for the job and candidates to evaluate. Please output the JSON evaluation list as requested:\n\n" + json.dumps(user_prompt, ensure_ascii=False, separators=(",", ":"))}
                 ]
                 
                 # DEBUG LOGGING
@@ -384,12 +383,8 @@ class LLMJudge:
                 logger.info(f"DEBUG: Job Title: {user_prompt['job'].get('title')}")
                 logger.info(f"DEBUG: Candidate count: {len(user_prompt['candidates'])}")
 
-                # Call LLM (synchronous call wrapped in executor)
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    partial(default_llm_client.chat_json, messages, timeout=180)
-                )
+                # Call LLM (synchronous call offloaded to the default executor)
+                response = await asyncio.to_thread(default_llm_client.chat_json, messages, timeout=180)
                 
                 # DEBUG LOGGING
                 logger.info(f"DEBUG: LLM Response received (Batch {batch_num})")
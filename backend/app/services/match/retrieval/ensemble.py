@@ -140,7 +140,7 @@ async def search_and_score_candidates(
         stmt = stmt.where(~Resume.id.in_(exclude_resume_ids))
 
     # Load candidates to score (DB selection is the only filtering stage)
-    resumes: list[Resume] = (await session.execute(stmt)).scalars().all()
+    resumes: list[Resume] = (await session.scalars(stmt)).all()
     logger.info("Loaded %d resumes to score", len(resumes))
     if not resumes:
         logger.info("No candidates found in DB")
@@ -1,16 +1,35 @@
 """Hybrid title matching combining semantic embeddings with keyword analysis and role knowledge base to match job titles across work history."""
 
 from __future__ import annotations
-import numpy as np
 from typing import List, Optional, Dict, Any, Set, Union
 import requests
 import logging
 from functools import lru_cache
 import asyncio
 
+from requests.adapters import HTTPAdapter
+
 from app.core.config import settings
+from app.services.common.llm_client import get_async_http
 from app.services.match.retrieval.tech_roles_knowledge import get_role_similarity_boost
 
+_ZERO_EMBEDDING = (0.0,) * 768
+_EMBEDDINGS_URL = f"{settings.OLLAMA_BASE_URL}/api/embeddings"
+
+# Keep-alive session for the sync path: one TCP connection per worker thread instead of one per title
+_http = requests.Session()
+_http.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+_http.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# Async path: a match run scores every candidate concurrently, so the same titles are requested
+# many times at once. Identical in-flight lookups share one request and at most
+# EMBEDDING_CONCURRENCY hit Ollama together; successful results are kept (FIFO-bounded).
+EMBEDDING_CONCURRENCY = 32
+_EMBEDDING_CACHE_SIZE = 1024
+_embedding_cache: dict[str, tuple] = {}
+_embedding_inflight: dict[str, asyncio.Task] = {}
+_embedding_slots = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+
 logger = logging.getLogger("match.title")
 
 
@@ -38,10 +57,10 @@ class TitleMatcher:
             # Normalize text before sending to cache/api
             clean_text = ' '.join(text.strip().split())
             if not clean_text:
-                return tuple(np.zeros(768))
+                return _ZERO_EMBEDDING
 
-            response = requests.post(
-                f"{settings.OLLAMA_BASE_URL}/api/embeddings",
+            response = _http.post(
+                _EMBEDDINGS_URL,
                 json={
                     "model": settings.EMBEDDING_MODEL,
                     "prompt": clean_text
@@ -53,7 +72,7 @@ class TitleMatcher:
             return tuple(embedding)
         except Exception as e:
             logger.error(f"Failed to get embedding from Ollama: {e}")
-            return tuple(np.zeros(768))
+            return _ZERO_EMBEDDING
 
     @staticmethod
     def normalize_title(title: str) -> str:
@@ -228,6 +247,8 @@ class TitleMatcher:
         Returns:
             Similarity score 0-100 (cosine similarity normalized)
         """
+        import numpy as np
+
         try:
             # Handle text1 (Job Title)
             if isinstance(text1, str):
@@ -349,11 +370,23 @@ class TitleMatcher:
     @staticmethod
     async def get_embedding_from_ollama_async(text: str) -> tuple:
         """
-        Non-blocking wrapper for the synchronous get_embedding_from_ollama.
-        Uses a thread to avoid blocking the main event loop.
+        Non-blocking embedding lookup over the shared pooled httpx client.
+        Concurrent calls for the same text are coalesced into one request.
         """
-        # This runs the blocking 'requests' call in a separate thread
-        return await asyncio.to_thread(TitleMatcher.get_embedding_from_ollama, text)
+        clean_text = ' '.join(text.strip().split())
+        if not clean_text:
+            return _ZERO_EMBEDDING
+        cached = _embedding_cache.get(clean_text)
+        if cached is not None:
+            return cached
+
+        task = _embedding_inflight.get(clean_text)
+        if task is None:
+            task = asyncio.ensure_future(_fetch_embedding_async(clean_text))
+            _embedding_inflight[clean_text] = task
+            task.add_done_callback(lambda _t: _embedding_inflight.pop(clean_text, None))
+        # Shielded: one cancelled caller must not cancel the lookup the others are awaiting
+        return await asyncio.shield(task)
 
     @staticmethod
     async def compute_detailed_match_async(
@@ -364,6 +397,8 @@ class TitleMatcher:
         history_titles: List[str] = None # <--- NEW PARAMETER
     ) -> Dict[str, Any]:
         """Async version of compute_detailed_match"""
+        import numpy as np
+
         if not job_title or not resume_titles:
             return {"score": 0.0, "best_title": "", "all_matches": []}
 
@@ -448,6 +483,30 @@ class TitleMatcher:
 
 
 # Legacy function signatures for backward compatibility
+async def _fetch_embedding_async(clean_text: str) -> tuple:
+    async with _embedding_slots:
+        try:
+            response = await get_async_http().post(
+                _EMBEDDINGS_URL,
+                json={
+                    "model": settings.EMBEDDING_MODEL,
+                    "prompt": clean_text
+                },
+                timeout=5
+            )
+            response.raise_for_status()
+            embedding = tuple(response.json()["embedding"])
+        except Exception as e:
+            logger.error("Failed to get embedding from Ollama: %s", e)
+            # Not cached, so the next match run retries
+            return _ZERO_EMBEDDING
+
+    if len(_embedding_cache) >= _EMBEDDING_CACHE_SIZE:
+        _embedding_cache.pop(next(iter(_embedding_cache)))
+    _embedding_cache[clean_text] = embedding
+    return embedding
+
+
 def calculate_title_similarity(job_title: str, resume_title: str) -> float:
     """
     Legacy function - uses semantic similarity now instead of Jaccard.
@@ -6,7 +6,8 @@ from datetime import datetime, timezone
 from uuid import UUID
 from pathlib import Path
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 
 from app.models import Job, JobCandidate, Resume
 from app.services.match.retrieval.ensemble import search_and_score_candidates
@@ -15,6 +16,12 @@ from app.services.resumes.ingestion_pipeline import _extract_profession
 
 logger = logging.getLogger("match.service")
 
+UPSERT_BATCH_SIZE = 1000  # rows per INSERT ... ON CONFLICT (keeps bind params well under 65k)
+
+
+class JobNotFoundError(ValueError):
+    """The job a match run was requested for does not exist."""
+
 
 class MatchService:
     """Main service for matching jobs to resumes."""
@@ -59,7 +66,7 @@ class MatchService:
         job: Job = await session.get(Job, job_id)
         if not job:
             logger.error("Job not found: %s", job_id)
-            raise ValueError(f"Job {job_id} not found")
+            raise JobNotFoundError(f"Job {job_id} not found")
         
         logger.info("Job loaded: '%s'", job.title)
         logger.info("")
@@ -72,8 +79,7 @@ class MatchService:
         # STEP 0: Get existing candidates (to check for previous LLM scores)
         logger.info("STEP 0: Checking for existing candidates...")
         stmt = select(JobCandidate).where(JobCandidate.job_id == job_id)
-        result = await session.execute(stmt)
-        existing_candidates = result.scalars().all()
+        existing_candidates = (await session.scalars(stmt)).all()
         
         # Map resume_id -> JobCandidate
         existing_candidates_map = {c.resume_id: c for c in existing_candidates}
@@ -129,7 +135,7 @@ class MatchService:
                 Resume.extraction_json.isnot(None),
                 Resume.status.notin_(("duplicate", "error")),
             )
-            all_resume_ids = (await session.execute(stmt_all)).scalars().all()
+            all_resume_ids = (await session.scalars(stmt_all)).all()
             
             new_resume_ids = [rid for rid in all_resume_ids if rid not in existing_resume_ids]
             
@@ -150,33 +156,42 @@ class MatchService:
         # STEP 1.5: Persist Stage 1 Scores (RAG)
         current_time_iso = datetime.now(timezone.utc).isoformat()
 
-        for cand_data in candidates_pool:
-            resume_id = cand_data["resume_id"]
-            rag_score = cand_data["rag_score"]
-            breakdown = cand_data.get("breakdown", {})
-            stability_detail = cand_data.get("stability_detail", {})
-            
-            # Get or create JobCandidate
-            job_candidate = existing_candidates_map.get(resume_id)
-            if not job_candidate:
-                job_candidate = JobCandidate(
-                    job_id=job_id,
-                    resume_id=resume_id,
-                    status="new"
-                )
-                session.add(job_candidate)
-                existing_candidates_map[resume_id] = job_candidate
-            
-            # Update Stage 1 info
-            job_candidate.rag_score = rag_score
-            
-            # Update analysis_json
-            current_analysis = dict(job_candidate.analysis_json) if job_candidate.analysis_json else {}
-            current_analysis["rag_breakdown"] = breakdown
-            current_analysis["stability"] = stability_detail
-            current_analysis["calculated_at"] = current_time_iso
-            job_candidate.analysis_json = current_analysis
-            
+        # One INSERT ... ON CONFLICT per batch instead of an ORM object per resume.
+        # New rows start as status 'new'; existing rows keep status/LLM fields and
+        # get the Stage 1 keys merged into analysis_json (jsonb ||).
+        # Keyed by resume_id: ON CONFLICT cannot touch the same row twice in one statement.
+        stage1_rows = list({
+            cand_data["resume_id"]: {
+                "job_id": job_id,
+                "resume_id": cand_data["resume_id"],
+                "status": "new",
+                "rag_score": cand_data["rag_score"],
+                "analysis_json": {
+                    "rag_breakdown": cand_data.get("breakdown", {}),
+                    "stability": cand_data.get("stability_detail", {}),
+                    "calculated_at": current_time_iso,
+                },
+            }
+            for cand_data in candidates_pool
+        }.values())
+        for start in range(0, len(stage1_rows), UPSERT_BATCH_SIZE):
+            stmt = pg_insert(JobCandidate).values(stage1_rows[start:start + UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_job_candidate_job_resume",
+                set_={
+                    "rag_score": stmt.excluded.rag_score,
+                    "analysis_json": func.coalesce(JobCandidate.analysis_json, literal({}, JSONB)).op("||")(
+                        stmt.excluded.analysis_json
+                    ),
+                    "updated_at": func.now(),
+                },
+            ).returning(JobCandidate)
+            # Autoflush writes pending changes (cleared LLM scores) first;
+            # populate_existing refreshes already-loaded candidates from RETURNING
+            upserted = await session.scalars(stmt, execution_options={"populate_existing": True})
+            for job_candidate in upserted:
+                existing_candidates_map[job_candidate.resume_id] = job_candidate
+
         await session.commit()
         logger.info("Persisted Stage 1 scores")
 
@@ -184,8 +199,7 @@ class MatchService:
         logger.info("STEP 2: Smart Backfill Loop (Target: %d good candidates)", top_n)
         
         # Helper to reconstruct candidate dict from DB record + Pool Data
-        async def reconstruct_candidate_data(jc: JobCandidate, pool_data: dict) -> dict | None:
-            resume = await session.get(Resume, jc.resume_id)
+        def reconstruct_candidate_data(jc: JobCandidate, resume, pool_data: dict) -> dict | None:
             if not resume:
                 return None
                 
@@ -254,12 +268,19 @@ class MatchService:
         # Build the working list
         all_candidates_data = []
         pool_map = {c["resume_id"]: c for c in candidates_pool}
+
+        # Fetch the needed resume columns for every candidate in one query (no per-row get)
+        resume_rows = await session.execute(
+            select(Resume.id, Resume.extraction_json, Resume.created_at, Resume.file_path)
+            .where(Resume.id.in_(list(existing_candidates_map)))
+        ) if existing_candidates_map else []
+        resumes_by_id = {row.id: row for row in resume_rows}
         
         for jc in existing_candidates_map.values():
             # Even if not in current pool (delta run), we want to include existing candidates
             pool_info = pool_map.get(jc.resume_id, {})
             
-            data = await reconstruct_candidate_data(jc, pool_info)
+            data = reconstruct_candidate_data(jc, resumes_by_id.get(jc.resume_id), pool_info)
             if data:
                 all_candidates_data.append(data)
         
@@ -21,6 +21,7 @@ from __future__ import annotations
 import math
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.core.config import settings
@@ -823,6 +824,12 @@ def _final_normalize(extraction: Dict[str, Any], cleaned_cluster: Dict[str, Any]
 
 # --------------------------------- LLM wrapper --------------------------------
 
+@lru_cache(maxsize=1)
+def _resume_llm_client() -> LLMClient:
+    """Client for the resume-specific model, built once instead of per extraction call."""
+    return LLMClient(model=settings.LLM_CHAT_MODEL_RESUME)
+
+
 def _call_llm_json(
     messages: List[Dict[str, str]],
     timeout: int = LLM_TIMEOUT_S,
@@ -834,7 +841,7 @@ def _call_llm_json(
     try:
         # Use resume-specific model if configured, otherwise default
         if settings.LLM_CHAT_MODEL_RESUME:
-            client = LLMClient(model=settings.LLM_CHAT_MODEL_RESUME)
+            client = _resume_llm_client()
         else:
             client = default_llm_client
 
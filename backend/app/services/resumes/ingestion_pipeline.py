@@ -11,10 +11,12 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 from uuid import UUID
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.resume import Resume
@@ -62,9 +64,8 @@ def parse_and_extract(db: Session, resume: Resume) -> Resume:
             # Don't delete! Just raise error so it gets marked as 'error' status.
             raise ValueError(f"Parsing failed: Text too short/empty.")
 
-        resume = resume_repo.attach_parsed_text(db, resume, parsed_text=txt or "")
-
-        resume_repo.set_status(db, resume, status="extracting")
+        # Text and the next status land in one commit
+        resume = resume_repo.update_resume(db, resume, parsed_text=txt or "", status="extracting", error=None)
         resume = extract_structured(db, resume)
 
         # --- DUPLICATE CHECK (ROBUST) ---
@@ -117,15 +118,13 @@ def parse_and_extract(db: Session, resume: Resume) -> Resume:
             else:
                 print(f"--- SKIP UPDATE: New file seems empty/partial. Keeping Master {duplicate.id} data intact. ---")
             
-            # Mark NEW record as DUPLICATE (Prevent Loop)
+            # Mark NEW record as DUPLICATE (Prevent Loop); commits the Master update with it
             resume_repo.set_status(
                 db, 
                 resume, 
                 status="duplicate", 
                 error=f"Duplicate of Master ID {duplicate.id}"
             )
-            
-            db.commit()
             return resume
         # -----------------------
 
@@ -181,28 +180,24 @@ def parse_and_extract(db: Session, resume: Resume) -> Resume:
 # LISTING & DETAIL (API COMPATIBILITY)
 # ---------------------------------------------------------------------
 
-def list_resume_summaries(
-    db: Session, *, offset: int = 0, limit: int = 20
+async def list_resume_summaries(
+    db: AsyncSession, *, offset: int = 0, limit: int = 20
 ) -> tuple[list[dict[str, Any]], int]:
-    rows, total = resume_repo.list_resumes(db, offset=offset, limit=limit)
+    rows, total = await resume_repo.list_resumes(db, offset=offset, limit=limit)
     items = [_resume_to_summary(row) for row in rows]
     return items, total
 
 
-def get_resume_detail(db: Session, resume_id: UUID) -> Optional[dict[str, Any]]:
-    resume = resume_repo.get_resume(db, resume_id)
+async def get_resume_detail(db: AsyncSession, resume_id: UUID) -> Optional[dict[str, Any]]:
+    resume = await resume_repo.get_resume(db, resume_id)
     if not resume:
         return None
     return _format_resume_detail(resume)
 
 
-def get_bulk_resume_details(db: Session, resume_ids: list[UUID]) -> list[dict[str, Any]]:
-    results = []
-    for rid in resume_ids:
-        resume = resume_repo.get_resume(db, rid)
-        if resume:
-            results.append(_format_resume_detail(resume))
-    return results
+async def get_bulk_resume_details(db: AsyncSession, resume_ids: list[UUID]) -> list[dict[str, Any]]:
+    resumes = await resume_repo.get_resumes(db, resume_ids)
+    return [_format_resume_detail(resume) for resume in resumes]
 
 
 def _format_resume_detail(resume: Resume) -> dict[str, Any]:
@@ -551,6 +546,7 @@ def _clean(value: Optional[str]) -> Optional[str]:
     return value.strip() if isinstance(value, str) and value.strip() else None
 
 
+@lru_cache(maxsize=4096)  # pure function of the path; hit for every listing/candidate row
 def _infer_name_from_path(path_str: str) -> Optional[str]:
     try:
         filename = Path(path_str).stem
@@ -753,8 +749,8 @@ def _parse_date(raw: Any, default_now: bool = False):
     return datetime.utcnow() if default_now else None
 
 
-def get_resume(db: Session, resume_id: UUID) -> Optional[Resume]:
-    return resume_repo.get_resume(db, resume_id)
+async def get_resume(db: AsyncSession, resume_id: UUID) -> Optional[Resume]:
+    return await resume_repo.get_resume(db, resume_id)
 
 
 def run_full_ingestion(db: Session, path: Path) -> Resume:
@@ -792,11 +788,9 @@ def run_full_ingestion(db: Session, path: Path) -> Resume:
         # If it fails here, it gets marked as ERROR and will be skipped next time.
         print(f"[Pipeline] ❌ Error: {path.name} -> {str(e)}")
         # Ensure the error is saved to DB so it becomes "Blacklisted"
-        resume.status = 'error'
-        resume.error_log = str(e)
-        db.commit()
+        resume_repo.set_status(db, resume, status="error", error=str(e))
         raise e
 
 
-def delete_resume(db: Session, resume_id: UUID) -> bool:
-    return resume_repo.delete_resume(db, resume_id)
+async def delete_resume(db: AsyncSession, resume_id: UUID) -> bool:
+    return await resume_repo.delete_resume(db, resume_id)
@@ -8,15 +8,11 @@ import mimetypes
 import os
 from pathlib import Path
 
-import fitz  # PyMuPDF
 import logging
 import subprocess
-from docx import Document
-from docx.document import Document as _Document
-from docx.oxml.text.paragraph import CT_P
-from docx.oxml.table import CT_Tbl
-from docx.table import _Cell, Table
-from docx.text.paragraph import Paragraph
+
+# PyMuPDF and python-docx are imported inside the parsers: together they cost ~100ms of
+# import time that the API process otherwise pays on startup for a mostly-worker code path
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +22,8 @@ def parse_pdf_content(file_content: bytes) -> str:
     Tries layout-preserving 'blocks' mode first.
     If that produces fragmented text (one char per line), falls back to 'text' mode.
     """
+    import fitz  # PyMuPDF
+
     try:
         doc = fitz.open(stream=file_content, filetype="pdf")
         full_text = []
@@ -328,6 +326,11 @@ def extract_text_from_docx(file_path: str) -> str:
     Uses XML parsing for Headers to catch Text Boxes/Shapes.
     Uses standard parsing for Body to preserve structure.
     """
+    from docx import Document
+    from docx.oxml.table import CT_Tbl
+    from docx.oxml.text.paragraph import CT_P
+    from docx.table import Table
+
     try:
         doc = Document(file_path)
         full_text = []
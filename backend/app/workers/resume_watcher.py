@@ -14,6 +14,7 @@ from watchdog.events import FileSystemEventHandler, FileCreatedEvent, FileModifi
 
 from app.db.base import SessionLocal
 from app.models.resume import Resume
+from app.repositories import resume_repo
 from app.services.resumes import ingestion_pipeline as resume_service
 
 # Resolve /app/data/resumes inside container
@@ -104,22 +105,20 @@ def _reset_stuck_jobs():
     print("----------------------------------------------------------------")
     db = SessionLocal()
     try:
-        # Find resumes that are stuck in active states
-        # We include 'processing', 'extracting', 'parsing', 'embedding' or None
-        stuck_resumes = db.query(Resume).filter(
-            Resume.status.in_(['processing', 'extracting', 'parsing', 'embedding']) | (Resume.status == None)
-        ).all()
-
-        if stuck_resumes:
-            print(f"[Watcher] ⚠️  Found {len(stuck_resumes)} stuck jobs from previous runs.")
-            for resume in stuck_resumes:
-                print(f"[Watcher] 💀 Marking stuck file as ERROR (Blacklist): {resume.file_path}")
-                # Move straight to error. Do not pass Go. Do not collect $200.
-                resume.status = 'error'
-                resume.error_log = "System crash or interruption during processing. File blacklisted."
-            
-            db.commit()
-            print(f"[Watcher] ✅ Cleanup complete. {len(stuck_resumes)} jobs blacklisted.")
+        # Resumes stuck in active states ('processing', 'extracting', 'parsing', 'embedding' or None)
+        # move straight to error. Do not pass Go. Do not collect $200. One UPDATE for all of them.
+        stuck_paths = resume_repo.mark_error_where_status(
+            db,
+            ['processing', 'extracting', 'parsing', 'embedding'],
+            error="System crash or interruption during processing. File blacklisted.",
+            include_null=True,
+        )
+
+        if stuck_paths:
+            print(f"[Watcher] ⚠️  Found {len(stuck_paths)} stuck jobs from previous runs.")
+            for file_path in stuck_paths:
+                print(f"[Watcher] 💀 Marked stuck file as ERROR (Blacklist): {file_path}")
+            print(f"[Watcher] ✅ Cleanup complete. {len(stuck_paths)} jobs blacklisted.")
         else:
             print("[Watcher] ✅ No stuck jobs found. System is clean.")
             
@@ -156,15 +155,13 @@ def main():
         # blacklisted them may be fixed. Delete the error rows so the scan below
         # re-ingests those files cleanly (the content-hash skip would otherwise
         # block them forever). No infinite loop: within a run it is still one strike.
-        error_rows = db.query(Resume).filter(Resume.status == 'error').all()
-        retried = 0
-        for row in error_rows:
-            if row.file_path and Path(row.file_path).exists():
-                print(f"[Watcher] 🔁 Second chance: clearing error record for {Path(row.file_path).name}")
-                db.delete(row)
-                retried += 1
+        retry_ids = []
+        for resume_id, file_path in resume_repo.list_files_with_status(db, 'error'):
+            if file_path and Path(file_path).exists():
+                print(f"[Watcher] 🔁 Second chance: clearing error record for {Path(file_path).name}")
+                retry_ids.append(resume_id)
+        retried = resume_repo.delete_resumes(db, retry_ids)
         if retried:
-            db.commit()
             print(f"[Watcher] 🔁 {retried} previously-failed files queued for retry.")
 
         # Fetch only file paths
@@ -5,7 +5,7 @@ import type { ApiJob } from '../../../types/job'
 import { FiChevronDown, FiChevronUp, FiHelpCircle, FiX, FiCheckCircle, FiXCircle, FiEye, FiClock } from 'react-icons/fi'
 import { localizeILPhone, formatILPhoneDisplay } from '../../../utils/phone'
 import { renderAsync } from 'docx-preview'
-import { updateCandidateStatus, updateCandidate } from '../../../services/jobs'
+import { updateCandidateStatus, updateCandidate, updateCandidates } from '../../../services/jobs'
 import { SegmentedControl } from '../../common/SegmentedControl/SegmentedControl'
 import BulkActions from '../BulkActions/BulkActions'
 
@@ -380,11 +380,10 @@ export default function Dashboard({ matchResults, selectedJob, showJobHeader = t
         idsToUpdate.includes(c.resume_id) ? { ...c, status: bulkStatusValue } : c
       ));
       
-      // Update all selected candidates
-      await Promise.all(
-        idsToUpdate.map(resumeId => 
-          updateCandidateStatus(selectedJob.id, resumeId, bulkStatusValue)
-        )
+      // Update all selected candidates in one request (single transaction)
+      await updateCandidates(
+        selectedJob.id,
+        idsToUpdate.map(resumeId => ({ resume_id: resumeId, status: bulkStatusValue }))
       );
       
       // Clear selection after successful update
@@ -87,6 +87,22 @@ export async function updateCandidate(
   return res.json();
 }
 
+export async function updateCandidates(
+  jobId: string,
+  updates: Array<{ resume_id: string; status?: string; notes?: string }>
+): Promise<{ status: string; updated: Array<{ resume_id: string; new_status: string; notes?: string }> }> {
+  const res = await fetch(`${API_URL}/jobs/${jobId}/candidates`, {
+    method: 'PUT',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(updates),
+  });
+  if (!res.ok) {
+    const text = await res.text().catch(() => '');
+    throw new Error(`Failed to update candidates (${res.status}): ${text}`);
+  }
+  return res.json();
+}
+
 // Deprecated: Use updateCandidate instead
 export async function updateCandidateStatus(jobId: string, resumeId: string, status: string) {
   return updateCandidate(jobId, resumeId, { status });